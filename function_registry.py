@@ -3,39 +3,100 @@ Central registry of all available helper functions.
 Used by Gemini to understand what operations are available.
 """
 
-from helpers.gdrive_helpers import GDRIVE_FUNCTIONS
-from helpers.gmail_helpers import GMAIL_FUNCTIONS
-from helpers.gcalendar_helpers import GCALENDAR_FUNCTIONS
-from helpers.google_docs_helpers import GOOGLE_DOCS_FUNCTIONS
-from helpers.notion_helpers import NOTION_FUNCTIONS
-from helpers.slack_helpers import SLACK_FUNCTIONS
-from helpers.discord_helpers import DISCORD_FUNCTIONS
-from helpers.trello_helpers import TRELLO_FUNCTIONS
-from helpers.github_helpers import GITHUB_FUNCTIONS
-
-
-# Map app names to their function registries
-FUNCTION_REGISTRY = {
-    "gmail": GMAIL_FUNCTIONS,
-    "google_calendar": GCALENDAR_FUNCTIONS,
-    "notion": NOTION_FUNCTIONS,
-    "slack": SLACK_FUNCTIONS,
-    "google_drive": GDRIVE_FUNCTIONS,
-    "google_docs": GOOGLE_DOCS_FUNCTIONS,
-    "discord": DISCORD_FUNCTIONS,
-    "trello": TRELLO_FUNCTIONS,
-    "github": GITHUB_FUNCTIONS,
+import importlib
+import json
+from functools import lru_cache
+
+# App name -> (helper module, registry constant). Helper modules are only
+# imported when their app's functions are first needed (PEP 562 for the
+# module-level names below)
+_REGISTRY_SOURCES = {
+    "gmail": ("helpers.gmail_helpers", "GMAIL_FUNCTIONS"),
+    "google_calendar": ("helpers.gcalendar_helpers", "GCALENDAR_FUNCTIONS"),
+    "notion": ("helpers.notion_helpers", "NOTION_FUNCTIONS"),
+    "slack": ("helpers.slack_helpers", "SLACK_FUNCTIONS"),
+    "google_drive": ("helpers.gdrive_helpers", "GDRIVE_FUNCTIONS"),
+    "google_docs": ("helpers.google_docs_helpers", "GOOGLE_DOCS_FUNCTIONS"),
+    "discord": ("helpers.discord_helpers", "DISCORD_FUNCTIONS"),
+    "trello": ("helpers.trello_helpers", "TRELLO_FUNCTIONS"),
+    "github": ("helpers.github_helpers", "GITHUB_FUNCTIONS"),
+}
+
+# Alternate app names used by workflows and older clients
+_ALIASES = {
+    "gcalendar": "google_calendar",
+    "calendar": "google_calendar",
+    "gdrive": "google_drive",
+    "gdocs": "google_docs",
 }
 
 
-def get_functions_for_apps(app_names: list[str]) -> dict:
+def _normalize_app_name(app_name: str) -> str:
+    """Map an app name to its canonical registry key."""
+    app_key = app_name.lower().replace(" ", "_")
+    return _ALIASES.get(app_key, app_key)
+
+
+@lru_cache(maxsize=None)
+def _load_app_functions(app_name: str) -> dict:
+    """Import an app's helper module and return its function registry."""
+    source = _REGISTRY_SOURCES.get(app_name)
+    if source is None:
+        return {}
+    module_name, registry_name = source
+    return getattr(importlib.import_module(module_name), registry_name)
+
+
+def __getattr__(name):
+    # Map app names to their function registries
+    if name == "FUNCTION_REGISTRY":
+        registry = {app: _load_app_functions(app) for app in _REGISTRY_SOURCES}
+        globals()[name] = registry
+        return registry
+
+    for app_name, (_, registry_name) in _REGISTRY_SOURCES.items():
+        if registry_name == name:
+            return _load_app_functions(app_name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=128)
+def get_functions_for_apps(app_names: tuple[str, ...]) -> dict:
     """
     Get function registry for specified apps.
 
+    Results are memoized, so callers should pass a sorted tuple
+    (e.g. tuple(sorted(apps))) and treat the returned dict as read-only.
+
     Args:
-        app_names: List of app names (e.g., ["gmail", "gcalendar"])
+        app_names: Tuple of app names (e.g., ("gmail", "gcalendar")); aliases
+            resolve to their canonical registry entry
 
     Returns:
         Dict mapping app names to their available functions
     """
-    return {app: FUNCTION_REGISTRY.get(app.lower(), {}) for app in app_names}
+    return {app: _load_app_functions(_normalize_app_name(app)) for app in app_names}
+
+
+@lru_cache(maxsize=128)
+def get_functions_json(app_names: tuple[str, ...]) -> str:
+    """
+    Get get_functions_for_apps(app_names) as indented JSON for LLM prompts.
+
+    The registries never change at runtime, so each app set is serialized once.
+
+    Args:
+        app_names: Tuple of app names, as passed to get_functions_for_apps
+
+    Returns:
+        JSON string of the apps' function registries
+    """
+    return json.dumps(get_functions_for_apps(app_names), indent=2)
+
+
+@lru_cache(maxsize=None)
+def get_registry_json() -> str:
+    """Get the full FUNCTION_REGISTRY as indented JSON, serialized once."""
+    registry = {app: _load_app_functions(app) for app in _REGISTRY_SOURCES}
+    return json.dumps(registry, indent=2)
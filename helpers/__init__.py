@@ -1,35 +1,52 @@
 """Helpers package for Blimp MCP Server."""
 
-from .gmail_helpers import *
-from .gcalendar_helpers import *
-from .gdrive_helpers import *
-from .notion_helpers import *
-from .slack_helpers import *
-from .discord_helpers import *
-
-__all__ = [
+import importlib
+
+# Public name -> submodule defining it. Submodules (and the SDKs they pull
+# in) are imported the first time one of their names is accessed (PEP 562),
+# so importing one helper doesn't load every provider's client library.
+_LAZY = {
     # Gmail
-    "list_messages",
-    "get_message",
-    "send_message",
-    "delete_message",
+    "GmailHelpers": ".gmail_helpers",
+    "GMAIL_FUNCTIONS": ".gmail_helpers",
     # Google Calendar
-    "list_events",
-    "create_event",
-    "update_event",
-    "delete_event",
+    "GCalendarHelpers": ".gcalendar_helpers",
+    "GCALENDAR_FUNCTIONS": ".gcalendar_helpers",
     # Google Drive
-    "list_files",
-    "upload_file",
-    "download_file",
-    "delete_file",
+    "GDriveHelpers": ".gdrive_helpers",
+    "GDRIVE_FUNCTIONS": ".gdrive_helpers",
+    # Google Docs
+    "GoogleDocsHelpers": ".google_docs_helpers",
+    "GOOGLE_DOCS_FUNCTIONS": ".google_docs_helpers",
     # Notion
-    "query_database",
-    "create_page",
-    "update_page",
+    "NotionHelpers": ".notion_helpers",
+    "NOTION_FUNCTIONS": ".notion_helpers",
     # Slack
-    "send_slack_message",
-    "list_channels",
+    "SlackHelpers": ".slack_helpers",
+    "SLACK_FUNCTIONS": ".slack_helpers",
     # Discord
-    "send_discord_message",
-]
+    "DiscordHelpers": ".discord_helpers",
+    "DISCORD_FUNCTIONS": ".discord_helpers",
+    # Trello
+    "TrelloHelpers": ".trello_helpers",
+    "TRELLO_FUNCTIONS": ".trello_helpers",
+    # GitHub
+    "GitHubHelpers": ".github_helpers",
+    "GITHUB_FUNCTIONS": ".github_helpers",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,41 @@
+"""
+Shared HTTP client for helpers that call REST APIs directly.
+Reusing one pooled client avoids a new TCP + TLS handshake on every call.
+"""
+
+import importlib.util
+from typing import Optional
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    Returns:
+        Pooled httpx.AsyncClient shared by all helpers
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            # Like requests: GitHub answers renamed repos with a redirect
+            follow_redirects=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=64),
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -3,17 +3,131 @@ Discord helper functions using Discord API.
 Provides operations for sending messages, managing channels, etc.
 """
 
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Set, Tuple
+import asyncio
 import httpx
+import json
 import logging
+import os
+import random
+import time
+
+from helpers._http import get_client
+from services.ttl_cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # optional: faster payload serialization
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# How many times a send rejected with 429 is retried
+MAX_RATE_LIMIT_RETRIES = 3
+
+# Plain-text messages sent to the same channel within this window are
+# combined into one post (0 disables coalescing)
+COALESCE_WINDOW_SECONDS = float(os.getenv("DISCORD_COALESCE_WINDOW_SECONDS", "0.5"))
+
+# Discord rejects content over 2000 characters; leave some headroom
+MAX_COALESCED_LENGTH = 1900
+
+# How long channel metadata from get_channel is reused
+CHANNEL_CACHE_TTL_SECONDS = 60
+
+
+@dataclass
+class _RateLimitBucket:
+    """Discord rate-limit state for one channel, from X-RateLimit-* headers."""
+    remaining: int = 1
+    reset_at: float = 0.0
+
 
 class DiscordHelpers:
     """Helper class for Discord operations."""
     
     BASE_URL = "https://discord.com/api/v10"
+
+    # Per-channel rate-limit buckets, shared by all sends
+    _buckets: Dict[str, _RateLimitBucket] = {}
+
+    # Successful get_channel results, per (token, channel)
+    _channel_cache = TTLCache(maxsize=1024, ttl=CHANNEL_CACHE_TTL_SECONDS)
+
+    # Messages waiting for the coalescing window, per (token, channel)
+    _pending: Dict[Tuple[str, str], List[Tuple[str, asyncio.Future]]] = {}
+
+    # Running flush tasks; the loop only keeps weak references to tasks, so
+    # they're held here until done
+    _flush_tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    async def _acquire(bucket: _RateLimitBucket) -> None:
+        """Wait until the bucket allows another request, then take a slot."""
+        while bucket.remaining <= 0:
+            delay = bucket.reset_at - time.monotonic()
+            if delay <= 0:
+                # Window has reset; the real limit comes back with the response
+                bucket.remaining = 1
+                break
+            await asyncio.sleep(delay)
+        bucket.remaining -= 1
+
+    @staticmethod
+    def _update_bucket(bucket: _RateLimitBucket, response: httpx.Response) -> None:
+        """Sync the bucket with the rate-limit headers of a response."""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset_after = response.headers.get("x-ratelimit-reset-after")
+        if remaining is not None:
+            bucket.remaining = int(remaining)
+        if reset_after is not None:
+            bucket.reset_at = time.monotonic() + float(reset_after)
+
+    @staticmethod
+    async def _post_message(
+        headers: Dict[str, str],
+        channel_id: str,
+        payload: Dict[str, Any]
+    ) -> httpx.Response:
+        """
+        POST a message to a channel, respecting Discord's rate limits.
+
+        Waits when the channel's bucket is exhausted instead of sending a
+        request that would be rejected, and retries 429 responses after the
+        Retry-After delay (backing off exponentially if none is given) plus
+        a little jitter.
+        """
+        bucket = DiscordHelpers._buckets.setdefault(channel_id, _RateLimitBucket())
+        url = f"{DiscordHelpers.BASE_URL}/channels/{channel_id}/messages"
+
+        # Serialized once up front and reused across retries; headers carry
+        # the JSON Content-Type
+        if orjson is not None:
+            body = orjson.dumps(payload)
+        else:
+            body = json.dumps(payload).encode("utf-8")
+
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await DiscordHelpers._acquire(bucket)
+            response = await get_client().post(url, headers=headers, content=body)
+            DiscordHelpers._update_bucket(bucket, response)
+
+            if response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                return response
+
+            try:
+                retry_after = float(response.json().get("retry_after", 0))
+            except ValueError:
+                retry_after = float(response.headers.get("retry-after", 0))
+            # Jitter keeps concurrent senders from retrying in lockstep
+            delay = max(retry_after, 0.5 * 2 ** attempt) + random.uniform(0, 0.25)
+            logger.warning(
+                f"Discord rate limited channel {channel_id}, retrying in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
+
+        return response
     
     @staticmethod
     async def send_message(
@@ -34,29 +148,90 @@ class DiscordHelpers:
         Returns:
             Dict with sent message data
         """
+        # Embeds can't be merged, so they always go out on their own
+        if embeds or COALESCE_WINDOW_SECONDS <= 0:
+            payload = {"content": content}
+            if embeds:
+                payload["embeds"] = embeds
+            return await DiscordHelpers._send(access_token, channel_id, payload)
+
+        key = (access_token, channel_id)
+        future = asyncio.get_running_loop().create_future()
+        pending = DiscordHelpers._pending.get(key)
+        if pending is None:
+            pending = DiscordHelpers._pending[key] = []
+            task = asyncio.create_task(DiscordHelpers._flush(access_token, channel_id))
+            DiscordHelpers._flush_tasks.add(task)
+            task.add_done_callback(DiscordHelpers._flush_tasks.discard)
+        pending.append((content, future))
+
+        return await future
+
+    @staticmethod
+    async def _flush(access_token: str, channel_id: str) -> None:
+        """
+        Send the messages queued for a channel during the coalescing window.
+
+        Contents are joined with newlines into as few posts as fit under
+        MAX_COALESCED_LENGTH; every caller gets the result of the post that
+        carried its content.
+        """
+        await asyncio.sleep(COALESCE_WINDOW_SECONDS)
+        batch = DiscordHelpers._pending.pop((access_token, channel_id), [])
+
+        groups = []
+        current = []
+        length = 0
+        for content, future in batch:
+            added = len(content) + (1 if current else 0)
+            if current and length + added > MAX_COALESCED_LENGTH:
+                groups.append(current)
+                current = []
+                added = len(content)
+                length = 0
+            current.append((content, future))
+            length += added
+        if current:
+            groups.append(current)
+
+        for group in groups:
+            try:
+                result = await DiscordHelpers._send(
+                    access_token,
+                    channel_id,
+                    {"content": "\n".join(content for content, _ in group)}
+                )
+            except Exception as error:
+                logger.error(f"Error sending coalesced Discord messages: {error}")
+                result = {"success": False, "error": str(error)}
+
+            for _, future in group:
+                if not future.done():
+                    future.set_result(result)
+
+    @staticmethod
+    async def _send(
+        access_token: str,
+        channel_id: str,
+        payload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Post a message payload and shape the result."""
         try:
             headers = {
                 "Authorization": f"Bot {access_token}",
                 "Content-Type": "application/json"
             }
             
-            payload = {"content": content}
-            if embeds:
-                payload["embeds"] = embeds
+            response = await DiscordHelpers._post_message(
+                headers, channel_id, payload
+            )
+            response.raise_for_status()
+            
+            return {
+                "success": True,
+                "message": response.json()
+            }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{DiscordHelpers.BASE_URL}/channels/{channel_id}/messages",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                
-                return {
-                    "success": True,
-                    "message": response.json()
-                }
-                
         except httpx.HTTPError as error:
             logger.error(f"Discord API error sending message: {error}")
             return {
@@ -79,23 +254,35 @@ class DiscordHelpers:
         Returns:
             Dict with channel data
         """
+        # Channel metadata rarely changes; concurrent misses share one fetch
+        return await DiscordHelpers._channel_cache.get_or_fetch(
+            (access_token, channel_id),
+            lambda: DiscordHelpers._fetch_channel(access_token, channel_id),
+            should_cache=lambda result: result.get("success"),
+        )
+
+    @staticmethod
+    async def _fetch_channel(
+        access_token: str,
+        channel_id: str
+    ) -> Dict[str, Any]:
+        """Fetch channel information from the Discord API."""
         try:
             headers = {
                 "Authorization": f"Bot {access_token}"
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{DiscordHelpers.BASE_URL}/channels/{channel_id}",
-                    headers=headers
-                )
-                response.raise_for_status()
-                
-                return {
-                    "success": True,
-                    "channel": response.json()
-                }
-                
+            response = await get_client().get(
+                f"{DiscordHelpers.BASE_URL}/channels/{channel_id}",
+                headers=headers
+            )
+            response.raise_for_status()
+            
+            return {
+                "success": True,
+                "channel": response.json()
+            }
+            
         except httpx.HTTPError as error:
             logger.error(f"Discord API error getting channel: {error}")
             return {
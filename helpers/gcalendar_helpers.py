@@ -3,26 +3,281 @@ Google Calendar helper functions using Google API Python Client.
 Provides CRUD operations for calendar events.
 """
 
+import asyncio
+import copy
+import hashlib
 import json
-from typing import Dict, List, Any, Optional
+import os
+import re
+import threading
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Set, Tuple
+import httplib2
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from googleapiclient.model import JsonModel
 from datetime import datetime, timedelta, timezone
-import dateparser
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from dateutil import parser as dateutil_parser
 import logging
 
+from services.ttl_cache import TTLCache
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of Calendar responses
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Calendar clients are reused per access token; Google access tokens live
+# for an hour, so entries expire well before most tokens do
+SERVICE_CACHE_TTL_SECONDS = 1800
+SERVICE_CACHE_MAXSIZE = 512
+
+# Retries for 429/5xx responses and connection errors, passed to
+# googleapiclient's num_retries (exponential backoff with jitter)
+CALENDAR_NUM_RETRIES = 3
+
+# Dedicated worker threads for googleapiclient's blocking transport
+# (service builds, requests and batches), so Calendar calls don't compete
+# with other asyncio.to_thread users
+CALENDAR_EXECUTOR_WORKERS = 32
+_executor = ThreadPoolExecutor(
+    max_workers=CALENDAR_EXECUTOR_WORKERS, thread_name_prefix="gcal"
+)
+
+# Per-worker-thread HTTP connections used by _execute_blocking
+_thread_local = threading.local()
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# None lets build() fall back to the stdlib-json JsonModel
+_JSON_MODEL = _OrjsonModel() if orjson is not None else None
+
+# Largest page events.list returns; used when streaming with iter_events
+MAX_EVENTS_PAGE_SIZE = 2500
+
+# Page size for summaries that read a whole time window: most weeks fit in
+# the first page, and busy calendars page instead of being truncated
+SUMMARY_EVENTS_PAGE_SIZE = 250
+
+# Calendar accepts up to 1000 calls per batch request; keep batches small
+# to stay clear of per-user rate limits
+CALENDAR_BATCH_SIZE = 50
+
+# get_event/list_events results are reused briefly for follow-up lookups;
+# any write through these helpers drops the user's cached reads
+EVENT_CACHE_TTL_SECONDS = 30
+EVENT_CACHE_MAXSIZE = 2048
+
+# delete_event calls for the same token within this window are sent as one
+# batch request (0 disables coalescing)
+DELETE_COALESCE_WINDOW_SECONDS = float(
+    os.getenv("GCALENDAR_DELETE_COALESCE_WINDOW_SECONDS", "0.01")
+)
+
+# Inputs with an explicit year are absolute dates that dateutil can parse;
+# relative phrases ("tomorrow", "next Monday") are left to dateparser
+_YEAR_RE = re.compile(r"\b\d{4}\b")
+
+# Loose address shape check for attendee lists
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+# Partial-response masks for events.get/list: only the event fields callers
+# and the chat responses use, so less JSON is transferred and parsed
+EVENT_FIELDS = (
+    "id,status,htmlLink,hangoutLink,summary,description,location,"
+    "start,end,recurringEventId,organizer(email,displayName),"
+    "attendees(email,displayName,responseStatus)"
+)
+EVENT_LIST_FIELDS = f"nextPageToken,items({EVENT_FIELDS})"
+WEEKLY_SCHEDULE_FIELDS = (
+    "nextPageToken,items(summary,start,end,location,attendees/email)"
+)
+RECENT_MEETING_FIELDS = (
+    "items(id,summary,description,location,start,end,"
+    "organizer/email,attendees/email)"
+)
+
+# Failures reported as {"success": False, ...} rather than raised: API errors,
+# plus httplib2/socket network errors and timeouts left over once retries
+# run out
+CALENDAR_API_ERRORS = (HttpError, httplib2.HttpLib2Error, OSError)
+
+# A cached Calendar service plus its events() collection, resolved once
+# since each service.events() call builds a new Resource
+_CalendarClient = namedtuple("_CalendarClient", "service events")
+
 
 class GCalendarHelpers:
     """Helper class for Google Calendar operations."""
 
+    _service_cache = TTLCache(
+        maxsize=SERVICE_CACHE_MAXSIZE, ttl=SERVICE_CACHE_TTL_SECONDS
+    )
+    _credentials_cache = TTLCache(
+        maxsize=SERVICE_CACHE_MAXSIZE, ttl=SERVICE_CACHE_TTL_SECONDS
+    )
+    _event_cache = TTLCache(maxsize=EVENT_CACHE_MAXSIZE, ttl=EVENT_CACHE_TTL_SECONDS)
+    # token key -> deletes waiting for the coalescing window to close
+    _pending_deletes: Dict[str, List[Tuple[str, str, asyncio.Future]]] = {}
+    # Running flush tasks; the loop only keeps weak references to tasks, so
+    # they're held here until done
+    _flush_tasks: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _token_key(access_token: str) -> str:
+        """Cache key for an access token, so raw tokens aren't kept as keys."""
+        return hashlib.blake2b(access_token.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _get_credentials(access_token: str) -> Credentials:
+        """Get the Credentials for an access token, creating them once."""
+        key = GCalendarHelpers._token_key(access_token)
+        credentials = GCalendarHelpers._credentials_cache.get(key)
+        if credentials is None:
+            credentials = Credentials(token=access_token)
+            GCalendarHelpers._credentials_cache.set(key, credentials)
+        return credentials
+
+    @staticmethod
+    async def _get_client(access_token: str) -> _CalendarClient:
+        """
+        Get the Calendar API client for an access token, building it once.
+
+        Concurrent callers with the same token share a single in-flight build.
+        """
+        credentials = GCalendarHelpers._get_credentials(access_token)
+        return await GCalendarHelpers._service_cache.get_or_fetch(
+            GCalendarHelpers._token_key(access_token),
+            lambda: asyncio.get_running_loop().run_in_executor(
+                _executor, GCalendarHelpers._build_client, credentials
+            ),
+        )
+
+    @staticmethod
+    def _build_client(credentials: Credentials) -> _CalendarClient:
+        """Create Calendar API service with the given credentials."""
+        # Imported on the first build so importing this module stays cheap
+        from googleapiclient.discovery import build
+
+        # The bundled discovery document avoids a fetch/cache lookup
+        service = build(
+            "calendar",
+            "v3",
+            credentials=credentials,
+            cache_discovery=False,
+            static_discovery=True,
+            model=_JSON_MODEL,
+        )
+        return _CalendarClient(service, service.events())
+
+    @staticmethod
+    async def _execute(request, access_token: str) -> Dict[str, Any]:
+        """Execute an API request without blocking the event loop."""
+        # Credentials are looked up here, on the loop, since the caches
+        # aren't thread-safe
+        credentials = GCalendarHelpers._get_credentials(access_token)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, GCalendarHelpers._execute_blocking, request, credentials
+        )
+
+    @staticmethod
+    def _execute_blocking(request, credentials: Credentials) -> Dict[str, Any]:
+        """Execute an API request with this thread's HTTP connection."""
+        # httplib2.Http isn't thread-safe, so each worker thread keeps its
+        # own connection instead of sharing the cached service's
+        http = getattr(_thread_local, "http", None)
+        if http is None:
+            # Same timeout as the shared httpx client, so a stalled call
+            # can't hold a worker thread indefinitely
+            http = _thread_local.http = httplib2.Http(timeout=10)
+        authed_http = AuthorizedHttp(credentials, http=http)
+        if isinstance(request, HttpRequest):
+            return request.execute(http=authed_http, num_retries=CALENDAR_NUM_RETRIES)
+        # Batch requests don't take num_retries
+        return request.execute(http=authed_http)
+
+    @staticmethod
+    async def _call(
+        access_token: str,
+        build_request: Callable[[Any], Any],
+        action: str,
+        shape: Callable[[Any], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Run a single events request and wrap the outcome in a result dict.
+
+        Args:
+            access_token: User's Google Calendar access token
+            build_request: Builds the request from the service's events resource
+            action: What the call does, for the error log (e.g. "getting event")
+            shape: Turns the API response into the result fields
+
+        Returns:
+            Dict with success and the shaped response, or the error
+        """
+        try:
+            client = await GCalendarHelpers._get_client(access_token)
+            response = await GCalendarHelpers._execute(
+                build_request(client.events), access_token
+            )
+            return {"success": True, **shape(response)}
+
+        except CALENDAR_API_ERRORS as error:
+            logger.error("Calendar API error %s: %s", action, error)
+            return {"success": False, "error": str(error)}
+
     @staticmethod
-    def _get_service(access_token: str):
-        """Create Calendar API service with access token."""
-        credentials = Credentials(token=access_token)
-        return build("calendar", "v3", credentials=credentials)
+    async def _cached_call(
+        access_token: str,
+        params: Dict[str, Any],
+        build_request: Callable[[Any], Any],
+        action: str,
+        shape: Callable[[Any], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        _call for read requests, reusing successful results for
+        EVENT_CACHE_TTL_SECONDS. Keyed on the token, action and params.
+
+        Every caller gets its own copy, so changes to a returned result never
+        reach the cached one or other callers.
+        """
+        key = (
+            GCalendarHelpers._token_key(access_token),
+            action,
+            tuple(sorted(params.items())),
+        )
+        result = await GCalendarHelpers._event_cache.get_or_fetch(
+            key,
+            lambda: GCalendarHelpers._call(access_token, build_request, action, shape),
+            should_cache=lambda result: result.get("success"),
+        )
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def _invalidate_events(access_token: str) -> None:
+        """Drop cached event reads for a token after it writes to the calendar."""
+        token_key = GCalendarHelpers._token_key(access_token)
+        GCalendarHelpers._event_cache.invalidate(lambda key: key[0] == token_key)
 
     @staticmethod
     async def list_events(
@@ -32,6 +287,7 @@ class GCalendarHelpers:
         time_max: Optional[str] = None,
         max_results: int = 10,
         query: Optional[str] = None,
+        fields: Optional[str] = EVENT_LIST_FIELDS,
     ) -> Dict[str, Any]:
         """
         List calendar events.
@@ -43,35 +299,181 @@ class GCalendarHelpers:
             time_max: Upper bound for event start time (ISO 8601)
             max_results: Maximum number of events to return
             query: Free text search query
+            fields: Partial-response mask (None for full events)
 
         Returns:
             Dict with events list
         """
+        params = GCalendarHelpers._list_params(
+            calendar_id, time_min, time_max, max_results, query, fields
+        )
+
+        def shape(events_result):
+            events = events_result.get("items", [])
+            return {"events": events, "count": len(events)}
+
+        return await GCalendarHelpers._cached_call(
+            access_token,
+            params,
+            lambda events: events.list(**params),
+            "listing events",
+            shape,
+        )
+
+    @staticmethod
+    def _list_params(
+        calendar_id: str,
+        time_min: Optional[str],
+        time_max: Optional[str],
+        max_results: int,
+        query: Optional[str],
+        fields: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build events.list parameters, skipping unset filters."""
+        params = {
+            "calendarId": calendar_id,
+            "maxResults": max_results,
+            "singleEvents": True,
+            "orderBy": "startTime",
+        }
+
+        if time_min:
+            params["timeMin"] = time_min
+        if time_max:
+            params["timeMax"] = time_max
+        if query:
+            params["q"] = query
+        if fields:
+            params["fields"] = fields
+
+        return params
+
+    @staticmethod
+    async def iter_events(
+        access_token: str,
+        calendar_id: str = "primary",
+        time_min: Optional[str] = None,
+        time_max: Optional[str] = None,
+        query: Optional[str] = None,
+        fields: Optional[str] = EVENT_LIST_FIELDS,
+        page_size: int = MAX_EVENTS_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all matching calendar events page by page. The next page is
+        fetched while the current one is being consumed.
+
+        Args:
+            access_token: User's Google Calendar access token
+            calendar_id: Calendar ID (default: "primary")
+            time_min: Lower bound for event start time (ISO 8601)
+            time_max: Upper bound for event start time (ISO 8601)
+            query: Free text search query
+            fields: Partial-response mask; must include nextPageToken to page
+            page_size: Events requested per page
+
+        Yields:
+            Event dicts, in start time order
+
+        Raises:
+            HttpError: If a page request fails
+        """
+        client = await GCalendarHelpers._get_client(access_token)
+        events_resource = client.events
+
+        request = events_resource.list(
+            **GCalendarHelpers._list_params(
+                calendar_id, time_min, time_max, page_size, query, fields
+            )
+        )
+        next_page = asyncio.ensure_future(
+            GCalendarHelpers._execute(request, access_token)
+        )
         try:
-            service = GCalendarHelpers._get_service(access_token)
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+
+                request = events_resource.list_next(request, response)
+                if request is not None:
+                    next_page = asyncio.ensure_future(
+                        GCalendarHelpers._execute(request, access_token)
+                    )
 
-            params = {
-                "calendarId": calendar_id,
-                "maxResults": max_results,
-                "singleEvents": True,
-                "orderBy": "startTime",
-            }
+                for event in response.get("items", []):
+                    yield event
+        finally:
+            # Stop the prefetch if the caller stops iterating early
+            if next_page is not None:
+                next_page.cancel()
 
-            if time_min:
-                params["timeMin"] = time_min
-            if time_max:
-                params["timeMax"] = time_max
-            if query:
-                params["q"] = query
+    @staticmethod
+    def _iso_window(days: int, back: bool = False) -> Tuple[str, str]:
+        """
+        Return (time_min, time_max) RFC3339 UTC strings spanning the next
+        `days` days from now, or the past `days` days when back is True.
+        """
+        now = datetime.utcnow()
+        now_iso = now.isoformat() + "Z"
+        if back:
+            return (now - timedelta(days=days)).isoformat() + "Z", now_iso
+        return now_iso, (now + timedelta(days=days)).isoformat() + "Z"
 
-            events_result = service.events().list(**params).execute()
-            events = events_result.get("items", [])
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _zone(tz_str: str) -> ZoneInfo:
+        """Load an IANA timezone, raising ValueError if it is unknown."""
+        try:
+            return ZoneInfo(tz_str)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: {tz_str}")
 
-            return {"success": True, "events": events, "count": len(events)}
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_absolute(dt_str: str, tz_str: str) -> Optional[str]:
+        """
+        Convert an absolute date/time string to RFC3339 UTC, reading naive
+        values in tz_str. Tries ISO 8601 first, then dateutil for other
+        formats with an explicit year. Returns None for anything else.
+        """
+        try:
+            parsed = datetime.fromisoformat(dt_str)
+        except ValueError:
+            if not _YEAR_RE.search(dt_str):
+                return None
+            try:
+                parsed = dateutil_parser.parse(dt_str)
+            except (ValueError, OverflowError):
+                return None
+
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=GCalendarHelpers._zone(tz_str))
+        return parsed.astimezone(timezone.utc).isoformat()
 
-        except HttpError as error:
-            logger.error(f"Calendar API error listing events: {error}")
-            return {"success": False, "error": str(error)}
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _natural_date_parser(tz_str: str):
+        """
+        Build the dateparser parser for natural-language times once per
+        timezone. English only, without the custom-format and no-spaces
+        parsers: scanning every locale is what makes dateparser slow.
+        Times are read in tz_str, like _parse_absolute does, and returned
+        in UTC.
+        """
+        # Imported here: loading dateparser compiles hundreds of regexes, and
+        # most calls never get past the absolute-date fast path
+        import dateparser
+
+        return dateparser.DateDataParser(
+            languages=["en"],
+            settings={
+                "RETURN_AS_TIMEZONE_AWARE": True,
+                "TIMEZONE": tz_str,
+                "TO_TIMEZONE": "UTC",
+                "PARSERS": ["timestamp", "relative-time", "absolute-time"],
+                # Scheduling input: "Monday 3pm" means the coming Monday
+                "PREFER_DATES_FROM": "future",
+            },
+        )
 
     @staticmethod
     def _parse_datetime(dt_str: str, tz_str: str = "UTC") -> str:
@@ -85,16 +487,79 @@ class GCalendarHelpers:
         if not dt_str:
             raise ValueError("Missing datetime string")
 
+        # Absolute dates (mostly ISO 8601) don't need dateparser
+        if isinstance(dt_str, str):
+            absolute = GCalendarHelpers._parse_absolute(dt_str, tz_str)
+            if absolute is not None:
+                return absolute
+
+        # Rejects unknown zones the same way the absolute-date path does
+        zone = GCalendarHelpers._zone(tz_str)
+
         # Try to parse natural language into a timezone-aware datetime
-        parsed = dateparser.parse(dt_str, settings={"RETURN_AS_TIMEZONE_AWARE": True})
+        parsed = (
+            GCalendarHelpers._natural_date_parser(tz_str)
+            .get_date_data(dt_str)
+            .date_obj
+        )
 
         if not parsed:
             raise ValueError(f"Could not parse datetime: {dt_str}")
 
-        # Convert to UTC for consistency, or adjust based on tz_str
+        # Convert to UTC for consistency; a naive result is read in tz_str
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=zone)
         parsed_utc = parsed.astimezone(timezone.utc)
         return parsed_utc.isoformat()
 
+    @staticmethod
+    def _pack_attendees(emails: List[str]) -> List[Dict[str, str]]:
+        """Build the API attendee list, keeping only well-formed addresses."""
+        fullmatch = _EMAIL_RE.fullmatch
+        return [
+            {"email": email}
+            for email in emails
+            if isinstance(email, str) and fullmatch(email)
+        ]
+
+    @staticmethod
+    def _build_event_body(
+        summary: str,
+        start_time: str,
+        end_time: str,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        attendees: Optional[List[str]] = None,
+        timezone: str = "UTC",
+    ) -> Dict[str, Any]:
+        """
+        Build an events.insert body. Raises ValueError if a time can't be parsed.
+        """
+        # 🔹 Dynamically parse natural language or ISO times
+        parsed_start = GCalendarHelpers._parse_datetime(start_time, timezone)
+        parsed_end = GCalendarHelpers._parse_datetime(end_time, timezone)
+
+        event = {
+            "summary": summary,
+            "start": {"dateTime": parsed_start, "timeZone": timezone},
+            "end": {"dateTime": parsed_end, "timeZone": timezone},
+        }
+
+        if description:
+            event["description"] = description
+        if location:
+            event["location"] = location
+        if isinstance(attendees, list):
+            valid = GCalendarHelpers._pack_attendees(attendees)
+            if valid:
+                event["attendees"] = valid
+            if len(valid) != len(attendees):
+                logger.info(
+                    "Skipping attendees — invalid or non-email format: %s", attendees
+                )
+
+        return event
+
     @staticmethod
     async def create_event(
         access_token: str,
@@ -111,49 +576,38 @@ class GCalendarHelpers:
         Create a calendar event. Accepts natural language or ISO-formatted times.
         """
         try:
-            service = GCalendarHelpers._get_service(access_token)
-
-            # 🔹 Dynamically parse natural language or ISO times
-            parsed_start = GCalendarHelpers._parse_datetime(start_time, timezone)
-            parsed_end = GCalendarHelpers._parse_datetime(end_time, timezone)
-
-            event = {
-                "summary": summary,
-                "start": {"dateTime": parsed_start, "timeZone": timezone},
-                "end": {"dateTime": parsed_end, "timeZone": timezone},
-            }
-
-            if description:
-                event["description"] = description
-            if location:
-                event["location"] = location
-            if isinstance(attendees, list) and all(
-                isinstance(a, str) and "@" in a for a in attendees
-            ):
-                event["attendees"] = [{"email": email} for email in attendees]
-            else:
-                logger.info(
-                    f"Skipping attendees — invalid or non-email format: {attendees}"
-                )
-
-            logger.info(f"Event payload: {json.dumps(event, indent=2)}")
-
-            created_event = (
-                service.events().insert(calendarId=calendar_id, body=event).execute()
+            event = GCalendarHelpers._build_event_body(
+                summary=summary,
+                start_time=start_time,
+                end_time=end_time,
+                description=description,
+                location=location,
+                attendees=attendees,
+                timezone=timezone,
             )
-
-            return {"success": True, "event": created_event}
-
-        except HttpError as error:
-            logger.error(f"Calendar API error creating event: {error}")
-            return {"success": False, "error": str(error)}
         except ValueError as ve:
-            logger.error(f"Invalid time input: {ve}")
+            logger.error("Invalid time input: %s", ve)
             return {"success": False, "error": str(ve)}
 
+        # Only serialize the payload when INFO records are actually emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Event payload: %s", json.dumps(event, indent=2))
+
+        result = await GCalendarHelpers._call(
+            access_token,
+            lambda events: events.insert(calendarId=calendar_id, body=event),
+            "creating event",
+            lambda created_event: {"event": created_event},
+        )
+        GCalendarHelpers._invalidate_events(access_token)
+        return result
+
     @staticmethod
     async def get_event(
-        access_token: str, event_id: str, calendar_id: str = "primary"
+        access_token: str,
+        event_id: str,
+        calendar_id: str = "primary",
+        fields: Optional[str] = EVENT_FIELDS,
     ) -> Dict[str, Any]:
         """
         Get a specific calendar event.
@@ -162,22 +616,22 @@ class GCalendarHelpers:
             access_token: User's Google Calendar access token
             event_id: ID of the event to retrieve
             calendar_id: Calendar ID (default: "primary")
+            fields: Partial-response mask (None returns the full event)
 
         Returns:
             Dict with event data
         """
-        try:
-            service = GCalendarHelpers._get_service(access_token)
-
-            event = (
-                service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-            )
-
-            return {"success": True, "event": event}
-
-        except HttpError as error:
-            logger.error(f"Calendar API error getting event: {error}")
-            return {"success": False, "error": str(error)}
+        params = {"calendarId": calendar_id, "eventId": event_id}
+        if fields:
+            params["fields"] = fields
+
+        return await GCalendarHelpers._cached_call(
+            access_token,
+            params,
+            lambda events: events.get(**params),
+            "getting event",
+            lambda event: {"event": event},
+        )
 
     @staticmethod
     async def update_event(
@@ -211,39 +665,302 @@ class GCalendarHelpers:
             Dict with updated event data
         """
         try:
-            service = GCalendarHelpers._get_service(access_token)
-            parsed_start = GCalendarHelpers._parse_datetime(start_time, timezone)
-            parsed_end = GCalendarHelpers._parse_datetime(end_time, timezone)
+            parsed_start = (
+                GCalendarHelpers._parse_datetime(start_time, timezone)
+                if start_time
+                else None
+            )
+            parsed_end = (
+                GCalendarHelpers._parse_datetime(end_time, timezone)
+                if end_time
+                else None
+            )
+        except ValueError as ve:
+            logger.error("Invalid time input: %s", ve)
+            return {"success": False, "error": str(ve)}
+
+        # PATCH only the supplied fields; no read-modify-write round trip
+        body = GCalendarHelpers._build_patch_body(
+            summary=summary,
+            parsed_start=parsed_start,
+            parsed_end=parsed_end,
+            description=description,
+            location=location,
+            attendees=attendees,
+            timezone=timezone,
+        )
+
+        result = await GCalendarHelpers._call(
+            access_token,
+            lambda events: events.patch(
+                calendarId=calendar_id, eventId=event_id, body=body
+            ),
+            "updating event",
+            lambda updated_event: {"event": updated_event},
+        )
+        GCalendarHelpers._invalidate_events(access_token)
+        return result
+
+    @staticmethod
+    def _build_patch_body(
+        summary: Optional[str] = None,
+        parsed_start: Optional[str] = None,
+        parsed_end: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        attendees: Optional[List[str]] = None,
+        timezone: str = "UTC",
+    ) -> Dict[str, Any]:
+        """Build an events.patch body holding only the fields being changed."""
+        changes = (
+            ("summary", summary),
+            (
+                "start",
+                {"dateTime": parsed_start, "timeZone": timezone}
+                if parsed_start
+                else None,
+            ),
+            (
+                "end",
+                {"dateTime": parsed_end, "timeZone": timezone} if parsed_end else None,
+            ),
+            ("description", description),
+            ("location", location),
+            (
+                "attendees",
+                GCalendarHelpers._pack_attendees(attendees) if attendees else None,
+            ),
+        )
+        return {key: value for key, value in changes if value}
 
-            # Get existing event
-            event = (
-                service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+    @staticmethod
+    def _batch_summary(results: List[Dict[str, Any]], count_key: str) -> Dict[str, Any]:
+        """Wrap per-item batch results with success/failure counts."""
+        succeeded = sum(1 for result in results if result.get("success"))
+        return {
+            "success": succeeded == len(results),
+            "results": results,
+            count_key: succeeded,
+            "failed": len(results) - succeeded,
+        }
+
+    @staticmethod
+    async def batch_create_events(
+        access_token: str,
+        events: List[Dict[str, Any]],
+        calendar_id: str = "primary",
+    ) -> Dict[str, Any]:
+        """
+        Create several calendar events using the batch endpoint.
+
+        Args:
+            access_token: User's Google Calendar access token
+            events: create_event arguments for each event (summary,
+                start_time, end_time and optional fields)
+            calendar_id: Calendar ID used when an event doesn't give one
+
+        Returns:
+            Dict with per-event results, in the order of events
+        """
+        try:
+            client = await GCalendarHelpers._get_client(access_token)
+            events_resource = client.events
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(events)
+            pending = []
+            for index, item in enumerate(events):
+                try:
+                    body = GCalendarHelpers._build_event_body(
+                        summary=item.get("summary"),
+                        start_time=item.get("start_time"),
+                        end_time=item.get("end_time"),
+                        description=item.get("description"),
+                        location=item.get("location"),
+                        attendees=item.get("attendees"),
+                        timezone=item.get("timezone", "UTC"),
+                    )
+                except ValueError as ve:
+                    results[index] = {"success": False, "error": str(ve)}
+                    continue
+
+                pending.append(
+                    (
+                        index,
+                        events_resource.insert(
+                            calendarId=item.get("calendar_id", calendar_id),
+                            body=body,
+                        ),
+                    )
+                )
+
+            created = await GCalendarHelpers.batch_execute(
+                access_token, [request for _, request in pending]
             )
+            GCalendarHelpers._invalidate_events(access_token)
+            if not created.get("success"):
+                return created
+
+            for position, (index, _) in enumerate(pending):
+                created_event = created["responses"][position]
+                if created_event is None:
+                    results[index] = {
+                        "success": False,
+                        "error": created["errors"].get(position, "Create failed"),
+                    }
+                else:
+                    results[index] = {"success": True, "event": created_event}
+
+            return GCalendarHelpers._batch_summary(results, "created")
+
+        except CALENDAR_API_ERRORS as error:
+            logger.error("Calendar API error batch creating events: %s", error)
+            return {"success": False, "error": str(error)}
 
-            # Update fields
-            if summary:
-                event["summary"] = summary
-            if start_time:
-                event["start"] = {"dateTime": parsed_start, "timeZone": timezone}
-            if end_time:
-                event["end"] = {"dateTime": parsed_end, "timeZone": timezone}
-            if description:
-                event["description"] = description
-            if location:
-                event["location"] = location
-            if attendees:
-                event["attendees"] = [{"email": email} for email in attendees]
-
-            updated_event = (
-                service.events()
-                .update(calendarId=calendar_id, eventId=event_id, body=event)
-                .execute()
+    @staticmethod
+    async def batch_update_events(
+        access_token: str,
+        updates: List[Dict[str, Any]],
+        calendar_id: str = "primary",
+    ) -> Dict[str, Any]:
+        """
+        Update several calendar events using the batch endpoint, patching
+        only the fields each update supplies.
+
+        Args:
+            access_token: User's Google Calendar access token
+            updates: update_event arguments for each event; each must include
+                event_id
+            calendar_id: Calendar ID used when an update doesn't give one
+
+        Returns:
+            Dict with per-event results, in the order of updates
+        """
+        try:
+            client = await GCalendarHelpers._get_client(access_token)
+            events_resource = client.events
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+            pending = []
+            for index, update in enumerate(updates):
+                if not update.get("event_id"):
+                    results[index] = {"success": False, "error": "Missing event_id"}
+                    continue
+
+                event_timezone = update.get("timezone", "UTC")
+                try:
+                    body = GCalendarHelpers._build_patch_body(
+                        summary=update.get("summary"),
+                        parsed_start=(
+                            GCalendarHelpers._parse_datetime(
+                                update["start_time"], event_timezone
+                            )
+                            if update.get("start_time")
+                            else None
+                        ),
+                        parsed_end=(
+                            GCalendarHelpers._parse_datetime(
+                                update["end_time"], event_timezone
+                            )
+                            if update.get("end_time")
+                            else None
+                        ),
+                        description=update.get("description"),
+                        location=update.get("location"),
+                        attendees=update.get("attendees"),
+                        timezone=event_timezone,
+                    )
+                except ValueError as ve:
+                    results[index] = {"success": False, "error": str(ve)}
+                    continue
+
+                pending.append(
+                    (
+                        index,
+                        events_resource.patch(
+                            calendarId=update.get("calendar_id", calendar_id),
+                            eventId=update["event_id"],
+                            body=body,
+                        ),
+                    )
+                )
+
+            saved = await GCalendarHelpers.batch_execute(
+                access_token, [request for _, request in pending]
             )
+            GCalendarHelpers._invalidate_events(access_token)
+            if not saved.get("success"):
+                return saved
+
+            for position, (index, _) in enumerate(pending):
+                updated_event = saved["responses"][position]
+                if updated_event is None:
+                    results[index] = {
+                        "success": False,
+                        "error": saved["errors"].get(position, "Update failed"),
+                    }
+                else:
+                    results[index] = {"success": True, "event": updated_event}
+
+            return GCalendarHelpers._batch_summary(results, "updated")
+
+        except CALENDAR_API_ERRORS as error:
+            logger.error("Calendar API error batch updating events: %s", error)
+            return {"success": False, "error": str(error)}
 
-            return {"success": True, "event": updated_event}
+    @staticmethod
+    async def batch_execute(access_token: str, requests: List[Any]) -> Dict[str, Any]:
+        """
+        Execute several Calendar API requests through the batch endpoint,
+        sending up to CALENDAR_BATCH_SIZE calls per HTTP request and running
+        the HTTP requests concurrently.
+
+        Args:
+            access_token: User's Google Calendar access token
+            requests: Unexecuted API requests (e.g. service.events().get(...))
+
+        Returns:
+            Dict with responses in request order (None where a call failed)
+            and errors keyed by request position
+        """
+        try:
+            client = await GCalendarHelpers._get_client(access_token)
+            service = client.service
+
+            responses: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+            errors: Dict[int, str] = {}
+
+            def handle_response(request_id, response, exception):
+                position = int(request_id)
+                if exception is not None:
+                    errors[position] = str(exception)
+                else:
+                    responses[position] = response
+
+            # new_batch_http_request targets Calendar's own batch endpoint
+            # (batch/calendar/v3) from the discovery document
+            batches = []
+            for start in range(0, len(requests), CALENDAR_BATCH_SIZE):
+                batch = service.new_batch_http_request(callback=handle_response)
+                for position in range(
+                    start, min(start + CALENDAR_BATCH_SIZE, len(requests))
+                ):
+                    batch.add(requests[position], request_id=str(position))
+                batches.append(batch)
+
+            # Each batch fills its own response slots, so they can run at once
+            await asyncio.gather(
+                *(GCalendarHelpers._execute(batch, access_token) for batch in batches)
+            )
 
-        except HttpError as error:
-            logger.error(f"Calendar API error updating event: {error}")
+            for position, error in errors.items():
+                logger.error(
+                    "Calendar API error in batch request %s: %s", position, error
+                )
+
+            return {"success": True, "responses": responses, "errors": errors}
+
+        except CALENDAR_API_ERRORS as error:
+            logger.error("Calendar API error executing batch: %s", error)
             return {"success": False, "error": str(error)}
 
     @staticmethod
@@ -261,15 +978,135 @@ class GCalendarHelpers:
         Returns:
             Dict with success status
         """
+        if DELETE_COALESCE_WINDOW_SECONDS <= 0:
+            return await GCalendarHelpers._delete_one(
+                access_token, event_id, calendar_id
+            )
+
+        key = GCalendarHelpers._token_key(access_token)
+        future = asyncio.get_running_loop().create_future()
+        pending = GCalendarHelpers._pending_deletes.get(key)
+        if pending is None:
+            pending = GCalendarHelpers._pending_deletes[key] = []
+            task = asyncio.create_task(GCalendarHelpers._flush_deletes(access_token))
+            GCalendarHelpers._flush_tasks.add(task)
+            task.add_done_callback(GCalendarHelpers._flush_tasks.discard)
+        pending.append((calendar_id, event_id, future))
+
+        return await future
+
+    @staticmethod
+    async def _delete_one(
+        access_token: str, event_id: str, calendar_id: str
+    ) -> Dict[str, Any]:
+        """Delete a single event with its own request."""
+        result = await GCalendarHelpers._call(
+            access_token,
+            lambda events: events.delete(calendarId=calendar_id, eventId=event_id),
+            "deleting event",
+            lambda _: {"event_id": event_id},
+        )
+        GCalendarHelpers._invalidate_events(access_token)
+        return result
+
+    @staticmethod
+    async def _flush_deletes(access_token: str) -> None:
+        """
+        Delete the events queued for a token during the coalescing window,
+        using one batch request when more than one is waiting. Every caller
+        gets the result for its own event.
+        """
+        await asyncio.sleep(DELETE_COALESCE_WINDOW_SECONDS)
+        queued = GCalendarHelpers._pending_deletes.pop(
+            GCalendarHelpers._token_key(access_token), []
+        )
+
         try:
-            service = GCalendarHelpers._get_service(access_token)
+            if len(queued) == 1:
+                calendar_id, event_id, _ = queued[0]
+                results = [
+                    await GCalendarHelpers._delete_one(
+                        access_token, event_id, calendar_id
+                    )
+                ]
+            else:
+                client = await GCalendarHelpers._get_client(access_token)
+                deleted = await GCalendarHelpers.batch_execute(
+                    access_token,
+                    [
+                        client.events.delete(calendarId=calendar_id, eventId=event_id)
+                        for calendar_id, event_id, _ in queued
+                    ],
+                )
+                GCalendarHelpers._invalidate_events(access_token)
+
+                if not deleted.get("success"):
+                    results = [deleted] * len(queued)
+                else:
+                    results = [
+                        {"success": True, "event_id": event_id}
+                        if deleted["responses"][position] is not None
+                        else {
+                            "success": False,
+                            "error": deleted["errors"].get(position, "Delete failed"),
+                        }
+                        for position, (_, event_id, _) in enumerate(queued)
+                    ]
+        except Exception as error:
+            logger.error("Error deleting coalesced Calendar events: %s", error)
+            results = [{"success": False, "error": str(error)}] * len(queued)
+
+        for (_, _, future), result in zip(queued, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    async def batch_delete_events(
+        access_token: str, event_ids: List[str], calendar_id: str = "primary"
+    ) -> Dict[str, Any]:
+        """
+        Delete several calendar events using the batch endpoint.
+
+        Args:
+            access_token: User's Google Calendar access token
+            event_ids: IDs of the events to delete
+            calendar_id: Calendar ID (default: "primary")
 
-            service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        Returns:
+            Dict with per-event results, in the order of event_ids
+        """
+        try:
+            client = await GCalendarHelpers._get_client(access_token)
+            events_resource = client.events
+
+            deleted = await GCalendarHelpers.batch_execute(
+                access_token,
+                [
+                    events_resource.delete(calendarId=calendar_id, eventId=event_id)
+                    for event_id in event_ids
+                ],
+            )
+            GCalendarHelpers._invalidate_events(access_token)
+            if not deleted.get("success"):
+                return deleted
+
+            results = []
+            for position, event_id in enumerate(event_ids):
+                if deleted["responses"][position] is None:
+                    results.append(
+                        {
+                            "success": False,
+                            "event_id": event_id,
+                            "error": deleted["errors"].get(position, "Delete failed"),
+                        }
+                    )
+                else:
+                    results.append({"success": True, "event_id": event_id})
 
-            return {"success": True, "event_id": event_id}
+            return GCalendarHelpers._batch_summary(results, "deleted")
 
-        except HttpError as error:
-            logger.error(f"Calendar API error deleting event: {error}")
+        except CALENDAR_API_ERRORS as error:
+            logger.error("Calendar API error batch deleting events: %s", error)
             return {"success": False, "error": str(error)}
 
     @staticmethod
@@ -292,12 +1129,7 @@ class GCalendarHelpers:
             Dict with upcoming events
         """
         try:
-            from datetime import datetime, timedelta
-
-            # Calculate time range
-            now = datetime.utcnow()
-            time_min = now.isoformat() + "Z"
-            time_max = (now + timedelta(days=days)).isoformat() + "Z"
+            time_min, time_max = GCalendarHelpers._iso_window(days)
 
             result = await GCalendarHelpers.list_events(
                 access_token=access_token,
@@ -319,12 +1151,160 @@ class GCalendarHelpers:
             return result
 
         except Exception as error:
-            logger.error(f"Error getting upcoming events: {error}")
+            logger.error("Error getting upcoming events: %s", error)
             return {"success": False, "error": str(error)}
 
+    @staticmethod
+    async def _list_calendars_events(
+        access_token: str,
+        calendar_ids: List[str],
+        time_min: str,
+        time_max: str,
+        max_results: Optional[int],
+        fields: str,
+    ) -> Dict[str, Any]:
+        """
+        List events in a time window across calendars. A single calendar uses
+        list_events; several are fetched in one batch request and merged in
+        start time order. With max_results None, every page of each calendar
+        is read instead (fields must then include nextPageToken).
+
+        Returns:
+            Dict with events, plus failed_calendars for calendars that errored
+        """
+        if max_results is None:
+            return await GCalendarHelpers._stream_calendars_events(
+                access_token, calendar_ids, time_min, time_max, fields
+            )
+
+        if len(calendar_ids) == 1:
+            return await GCalendarHelpers.list_events(
+                access_token=access_token,
+                calendar_id=calendar_ids[0],
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                fields=fields,
+            )
+
+        client = await GCalendarHelpers._get_client(access_token)
+        listed = await GCalendarHelpers.batch_execute(
+            access_token,
+            [
+                client.events.list(
+                    **GCalendarHelpers._list_params(
+                        calendar_id, time_min, time_max, max_results, None, fields
+                    )
+                )
+                for calendar_id in calendar_ids
+            ],
+        )
+        if not listed.get("success"):
+            return listed
+
+        events = []
+        failed_calendars = {}
+        for position, calendar_id in enumerate(calendar_ids):
+            response = listed["responses"][position]
+            if response is None:
+                failed_calendars[calendar_id] = listed["errors"].get(position)
+            else:
+                events.extend(response.get("items", ()))
+
+        return GCalendarHelpers._merge_calendars_events(
+            calendar_ids, events, failed_calendars
+        )
+
+    @staticmethod
+    async def _stream_calendars_events(
+        access_token: str,
+        calendar_ids: List[str],
+        time_min: str,
+        time_max: str,
+        fields: str,
+    ) -> Dict[str, Any]:
+        """
+        Read every event in a time window from each calendar, following
+        nextPageToken with iter_events. Calendars are read concurrently.
+
+        Returns:
+            Dict with events, plus failed_calendars for calendars that errored
+        """
+
+        async def collect(calendar_id):
+            return [
+                event
+                async for event in GCalendarHelpers.iter_events(
+                    access_token,
+                    calendar_id=calendar_id,
+                    time_min=time_min,
+                    time_max=time_max,
+                    fields=fields,
+                    page_size=SUMMARY_EVENTS_PAGE_SIZE,
+                )
+            ]
+
+        listed = await asyncio.gather(
+            *(collect(calendar_id) for calendar_id in calendar_ids),
+            return_exceptions=True,
+        )
+
+        events = []
+        failed_calendars = {}
+        for calendar_id, result in zip(calendar_ids, listed):
+            if isinstance(result, CALENDAR_API_ERRORS):
+                logger.error(
+                    "Calendar API error listing events for %s: %s",
+                    calendar_id,
+                    result,
+                )
+                failed_calendars[calendar_id] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                events.extend(result)
+
+        return GCalendarHelpers._merge_calendars_events(
+            calendar_ids, events, failed_calendars
+        )
+
+    @staticmethod
+    def _merge_calendars_events(
+        calendar_ids: List[str],
+        events: List[Dict[str, Any]],
+        failed_calendars: Dict[str, Optional[str]],
+    ) -> Dict[str, Any]:
+        """Wrap events listed from one or more calendars, in start time order."""
+        if len(failed_calendars) == len(calendar_ids):
+            return {"success": False, "error": failed_calendars[calendar_ids[0]]}
+
+        # Calendars report times in their own offsets, so compare instants
+        def start_of(event):
+            start = event.get("start") or {}
+            value = start.get("dateTime") or start.get("date")
+            if not value:
+                return datetime.min.replace(tzinfo=timezone.utc)
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed
+
+        # A single calendar is already listed in start time order
+        if len(calendar_ids) > 1:
+            events.sort(key=start_of)
+
+        return {
+            "success": True,
+            "events": events,
+            "count": len(events),
+            "failed_calendars": failed_calendars,
+        }
+
     @staticmethod
     async def summarize_weekly_schedule(
-        access_token: str, calendar_id: str = "primary"
+        access_token: str,
+        calendar_id: str = "primary",
+        calendar_ids: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get a summary of the week's schedule.
@@ -332,24 +1312,23 @@ class GCalendarHelpers:
         Args:
             access_token: User's Google Calendar access token
             calendar_id: Calendar ID (default: "primary")
+            calendar_ids: Several calendars to combine (overrides calendar_id)
 
         Returns:
             Dict with weekly schedule summary
         """
         try:
-            from datetime import datetime, timedelta
-
             # Get events for the next 7 days
-            now = datetime.utcnow()
-            time_min = now.isoformat() + "Z"
-            time_max = (now + timedelta(days=7)).isoformat() + "Z"
+            time_min, time_max = GCalendarHelpers._iso_window(7)
 
-            result = await GCalendarHelpers.list_events(
-                access_token=access_token,
-                calendar_id=calendar_id,
+            result = await GCalendarHelpers._list_calendars_events(
+                access_token,
+                calendar_ids or [calendar_id],
                 time_min=time_min,
                 time_max=time_max,
-                max_results=100,
+                # Read the whole week, page by page, rather than truncating
+                max_results=None,
+                fields=WEEKLY_SCHEDULE_FIELDS,
             )
 
             if not result.get("success"):
@@ -357,39 +1336,36 @@ class GCalendarHelpers:
 
             events = result.get("events", [])
 
-            # Organize events by day
-            daily_schedule = {}
+            # Organize events by day in a single pass
+            daily_schedule = defaultdict(list)
             for event in events:
-                start = event.get("start", {})
+                get = event.get
+                start = get("start") or {}
                 start_time = start.get("dateTime") or start.get("date")
 
                 if start_time:
-                    # Extract date
-                    event_date = start_time.split("T")[0]
-
-                    if event_date not in daily_schedule:
-                        daily_schedule[event_date] = []
-
-                    daily_schedule[event_date].append(
+                    end = get("end") or {}
+                    attendees = get("attendees")
+                    # ISO dates and datetimes both start with YYYY-MM-DD
+                    daily_schedule[start_time[:10]].append(
                         {
-                            "summary": event.get("summary", "No Title"),
+                            "summary": get("summary", "No Title"),
                             "start": start_time,
-                            "end": event.get("end", {}).get("dateTime")
-                            or event.get("end", {}).get("date"),
-                            "location": event.get("location"),
-                            "attendees": len(event.get("attendees", [])),
+                            "end": end.get("dateTime") or end.get("date"),
+                            "location": get("location"),
+                            "attendees": len(attendees) if attendees else 0,
                         }
                     )
 
             return {
                 "success": True,
-                "weekly_schedule": daily_schedule,
+                "weekly_schedule": dict(daily_schedule),
                 "total_events": len(events),
                 "days_with_events": len(daily_schedule),
             }
 
         except Exception as error:
-            logger.error(f"Error summarizing weekly schedule: {error}")
+            logger.error("Error summarizing weekly schedule: %s", error)
             return {"success": False, "error": str(error)}
 
     @staticmethod
@@ -398,6 +1374,7 @@ class GCalendarHelpers:
         days: int = 7,
         max_results: int = 20,
         calendar_id: str = "primary",
+        calendar_ids: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get recent meetings (events with attendees).
@@ -405,26 +1382,23 @@ class GCalendarHelpers:
         Args:
             access_token: User's Google Calendar access token
             days: Number of days to look back (default: 7)
-            max_results: Maximum number of meetings to return
+            max_results: Maximum number of meetings to return per calendar
             calendar_id: Calendar ID (default: "primary")
+            calendar_ids: Several calendars to combine (overrides calendar_id)
 
         Returns:
             Dict with recent meetings
         """
         try:
-            from datetime import datetime, timedelta
+            time_min, time_max = GCalendarHelpers._iso_window(days, back=True)
 
-            # Calculate time range
-            now = datetime.utcnow()
-            time_min = (now - timedelta(days=days)).isoformat() + "Z"
-            time_max = now.isoformat() + "Z"
-
-            result = await GCalendarHelpers.list_events(
-                access_token=access_token,
-                calendar_id=calendar_id,
+            result = await GCalendarHelpers._list_calendars_events(
+                access_token,
+                calendar_ids or [calendar_id],
                 time_min=time_min,
                 time_max=time_max,
                 max_results=max_results,
+                fields=RECENT_MEETING_FIELDS,
             )
 
             if not result.get("success"):
@@ -435,20 +1409,21 @@ class GCalendarHelpers:
             # Filter for meetings (events with attendees)
             meetings = []
             for event in events:
-                attendees = event.get("attendees", [])
+                get = event.get
+                attendees = get("attendees")
                 if attendees:
+                    start = get("start") or {}
+                    end = get("end") or {}
                     meetings.append(
                         {
-                            "id": event.get("id"),
-                            "summary": event.get("summary", "No Title"),
-                            "start": event.get("start", {}).get("dateTime")
-                            or event.get("start", {}).get("date"),
-                            "end": event.get("end", {}).get("dateTime")
-                            or event.get("end", {}).get("date"),
-                            "location": event.get("location"),
+                            "id": get("id"),
+                            "summary": get("summary", "No Title"),
+                            "start": start.get("dateTime") or start.get("date"),
+                            "end": end.get("dateTime") or end.get("date"),
+                            "location": get("location"),
                             "attendees": [a.get("email") for a in attendees],
-                            "description": event.get("description"),
-                            "organizer": event.get("organizer", {}).get("email"),
+                            "description": get("description"),
+                            "organizer": (get("organizer") or {}).get("email"),
                         }
                     )
 
@@ -460,7 +1435,7 @@ class GCalendarHelpers:
             }
 
         except Exception as error:
-            logger.error(f"Error getting recent meetings: {error}")
+            logger.error("Error getting recent meetings: %s", error)
             return {"success": False, "error": str(error)}
 
     @staticmethod
@@ -479,10 +1454,7 @@ class GCalendarHelpers:
             Dict with free/busy information, including available times
         """
         try:
-            # Calculate time range
-            now = datetime.utcnow()
-            time_min = now.isoformat() + "Z"
-            time_max = (now + timedelta(days=int(days))).isoformat() + "Z"
+            time_min, time_max = GCalendarHelpers._iso_window(int(days))
 
             body = {
                 "timeMin": time_min,
@@ -490,8 +1462,11 @@ class GCalendarHelpers:
                 "items": [{"id": calendar_id}],
             }
 
-            service = GCalendarHelpers._get_service(access_token)
-            freebusy_result = service.freebusy().query(body=body).execute()
+            client = await GCalendarHelpers._get_client(access_token)
+            service = client.service
+            freebusy_result = await GCalendarHelpers._execute(
+                service.freebusy().query(body=body), access_token
+            )
 
             calendars = freebusy_result.get("calendars", {})
             calendar_data = calendars.get(calendar_id, {})
@@ -527,8 +1502,8 @@ class GCalendarHelpers:
                 "days_ahead": days,
             }
 
-        except HttpError as error:
-            logger.error(f"Calendar API error getting free/busy: {error}")
+        except CALENDAR_API_ERRORS as error:
+            logger.error("Calendar API error getting free/busy: %s", error)
             return {"success": False, "error": str(error)}
 
 
@@ -582,6 +1557,22 @@ GCALENDAR_FUNCTIONS = {
             "timezone": "Timezone for the event (default: 'UTC')",
         },
     },
+    "batch_create_events": {
+        "name": "batch_create_events",
+        "description": "Create several calendar events at once",
+        "parameters": {
+            "events": "List of events, each with summary, start_time, end_time and any optional create_event fields",
+            "calendar_id": "Calendar ID (default: 'primary')",
+        },
+    },
+    "batch_update_events": {
+        "name": "batch_update_events",
+        "description": "Update several calendar events at once",
+        "parameters": {
+            "updates": "List of updates, each with event_id and any update_event fields to change",
+            "calendar_id": "Calendar ID (default: 'primary')",
+        },
+    },
     "delete_event": {
         "name": "delete_event",
         "description": "Delete a calendar event",
@@ -590,6 +1581,14 @@ GCALENDAR_FUNCTIONS = {
             "calendar_id": "Calendar ID (default: 'primary')",
         },
     },
+    "batch_delete_events": {
+        "name": "batch_delete_events",
+        "description": "Delete several calendar events at once",
+        "parameters": {
+            "event_ids": "List of IDs of the events to delete",
+            "calendar_id": "Calendar ID (default: 'primary')",
+        },
+    },
     "get_upcoming_events": {
         "name": "get_upcoming_events",
         "description": "Get upcoming events for the next N days",
@@ -602,7 +1601,10 @@ GCALENDAR_FUNCTIONS = {
     "summarize_weekly_schedule": {
         "name": "summarize_weekly_schedule",
         "description": "Get a summary of the week's schedule organized by day",
-        "parameters": {"calendar_id": "Calendar ID (default: 'primary')"},
+        "parameters": {
+            "calendar_id": "Calendar ID (default: 'primary')",
+            "calendar_ids": "List of calendar IDs to combine (optional, overrides calendar_id)",
+        },
     },
     "get_recent_meetings": {
         "name": "get_recent_meetings",
@@ -611,6 +1613,7 @@ GCALENDAR_FUNCTIONS = {
             "days": "Number of days to look back (default: 7)",
             "max_results": "Maximum number of meetings to return (default: 20)",
             "calendar_id": "Calendar ID (default: 'primary')",
+            "calendar_ids": "List of calendar IDs to combine (optional, overrides calendar_id)",
         },
     },
     "get_free_busy_times": {
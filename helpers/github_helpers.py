@@ -4,9 +4,10 @@ Provides operations for repositories, issues, pull requests, etc.
 """
 
 from typing import Dict, List, Any, Optional
-import requests
 import logging
 
+from helpers._http import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,7 +44,7 @@ class GitHubHelpers:
             params = {"per_page": per_page, "sort": "updated", "direction": "desc"}
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             repos = response.json()
 
@@ -79,7 +80,7 @@ class GitHubHelpers:
             }
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             issues = response.json()
 
@@ -120,7 +121,7 @@ class GitHubHelpers:
             }
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             prs = response.json()
 
@@ -165,7 +166,7 @@ class GitHubHelpers:
             if labels:
                 payload["labels"] = labels
 
-            response = requests.post(url, json=payload, headers=headers)
+            response = await get_client().post(url, json=payload, headers=headers)
             response.raise_for_status()
             issue = response.json()
 
@@ -195,7 +196,7 @@ class GitHubHelpers:
             params = {"q": query, "per_page": per_page, "sort": "updated"}
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             result = response.json()
 
@@ -236,7 +237,7 @@ class GitHubHelpers:
             }
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             commits = response.json()
 
@@ -297,7 +298,7 @@ class GitHubHelpers:
             }
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             prs = response.json()
 
@@ -380,7 +381,7 @@ class GitHubHelpers:
             }
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params=params, headers=headers)
+            response = await get_client().get(url, params=params, headers=headers)
             response.raise_for_status()
             prs = response.json()
 
@@ -456,13 +457,15 @@ class GitHubHelpers:
             url = f"{GitHubHelpers.BASE_URL}/repos/{repo}/pulls/{pr_number}/comments"
             headers = GitHubHelpers._get_headers(access_token)
 
-            response = requests.get(url, params={"per_page": 100}, headers=headers)
+            response = await get_client().get(
+                url, params={"per_page": 100}, headers=headers
+            )
             response.raise_for_status()
             comments = response.json()
 
             # Also get review comments (different endpoint)
             review_url = f"{GitHubHelpers.BASE_URL}/repos/{repo}/pulls/{pr_number}/reviews"
-            review_response = requests.get(
+            review_response = await get_client().get(
                 review_url, params={"per_page": 100}, headers=headers
             )
             review_response.raise_for_status()
@@ -3,6 +3,7 @@ Gmail helper functions using Google API Python Client.
 Provides CRUD operations for Gmail messages, labels, drafts, etc.
 """
 
+import asyncio
 from typing import Dict, List, Any, Optional
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
@@ -14,6 +15,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Gmail accepts up to 100 calls per batch request but recommends at most 50
+# to avoid rate limiting
+GMAIL_BATCH_SIZE = 50
+
 
 class GmailHelpers:
     """Helper class for Gmail operations."""
@@ -106,6 +111,7 @@ class GmailHelpers:
         message_id: str,
         format: str = "full",
         credentials: Optional[Dict[str, Any]] = None,
+        fields: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get a specific Gmail message.
@@ -115,22 +121,27 @@ class GmailHelpers:
             message_id: ID of the message to retrieve
             format: Format of the message (full, metadata, minimal, raw)
             credentials: Full OAuth credentials dictionary (preferred)
+            fields: Optional partial-response field mask limiting what the
+                API returns (and what has to be parsed)
 
         Returns:
             Dict with message data
         """
         try:
-            if credentials:
-                service = GmailHelpers._get_service(credentials)
-            else:
-                service = GmailHelpers._get_service({"access_token": access_token})
+            params = {"userId": "me", "id": message_id, "format": format}
+            if fields:
+                params["fields"] = fields
 
-            message = (
-                service.users()
-                .messages()
-                .get(userId="me", id=message_id, format=format)
-                .execute()
-            )
+            def fetch():
+                if credentials:
+                    service = GmailHelpers._get_service(credentials)
+                else:
+                    service = GmailHelpers._get_service({"access_token": access_token})
+                return service.users().messages().get(**params).execute()
+
+            # Building the service and the round-trip are blocking; keep them
+            # off the event loop so concurrent fetches overlap
+            message = await asyncio.to_thread(fetch)
 
             return {"success": True, "message": message}
 
@@ -138,6 +149,78 @@ class GmailHelpers:
             logger.error(f"Gmail API error getting message: {message_id} {error}")
             return {"success": False, "error": str(error)}
 
+    @staticmethod
+    async def batch_get_messages(
+        access_token: str,
+        message_ids: List[str],
+        format: str = "full",
+        credentials: Optional[Dict[str, Any]] = None,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get several Gmail messages using the batch endpoint, sending up to
+        GMAIL_BATCH_SIZE messages.get calls per HTTP request.
+
+        Args:
+            access_token: User's Gmail access token (deprecated, use credentials)
+            message_ids: IDs of the messages to retrieve
+            format: Format of the messages (full, metadata, minimal, raw)
+            credentials: Full OAuth credentials dictionary (preferred)
+            fields: Optional partial-response field mask applied to each message
+
+        Returns:
+            Dict with the messages that were retrieved (in message_ids order)
+            and per-message errors
+        """
+        try:
+            messages_by_id = {}
+            errors = {}
+
+            def handle_response(request_id, response, exception):
+                if exception is not None:
+                    errors[request_id] = str(exception)
+                else:
+                    messages_by_id[request_id] = response
+
+            def execute_batches():
+                if credentials:
+                    service = GmailHelpers._get_service(credentials)
+                else:
+                    service = GmailHelpers._get_service({"access_token": access_token})
+
+                for start in range(0, len(message_ids), GMAIL_BATCH_SIZE):
+                    batch = service.new_batch_http_request(callback=handle_response)
+                    for message_id in message_ids[start : start + GMAIL_BATCH_SIZE]:
+                        params = {"userId": "me", "id": message_id, "format": format}
+                        if fields:
+                            params["fields"] = fields
+                        batch.add(
+                            service.users().messages().get(**params),
+                            request_id=message_id,
+                        )
+                    batch.execute()
+
+            # Building the service and the batch round-trips are blocking;
+            # keep them off the event loop
+            await asyncio.to_thread(execute_batches)
+
+            for message_id, error in errors.items():
+                logger.error(f"Gmail API error getting message: {message_id} {error}")
+
+            return {
+                "success": True,
+                "messages": [
+                    messages_by_id[message_id]
+                    for message_id in message_ids
+                    if message_id in messages_by_id
+                ],
+                "errors": errors,
+            }
+
+        except HttpError as error:
+            logger.error(f"Gmail API error batch getting messages: {error}")
+            return {"success": False, "error": str(error)}
+
     @staticmethod
     async def send_message(
         access_token: str,
@@ -11,6 +11,7 @@ This is a non-restricted scope that doesn't require security assessment.
 Google Docs are stored in Drive, so drive.file scope provides both Docs API and Drive API access.
 """
 
+import asyncio
 from typing import Dict, List, Any, Optional
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
@@ -258,26 +259,36 @@ class GoogleDocsHelpers:
             Dict with document details
         """
         try:
-            if credentials:
-                service = GoogleDocsHelpers._get_service(credentials)
-            else:
-                service = GoogleDocsHelpers._get_service({"access_token": access_token})
 
-            doc = service.documents().create(body={"title": title}).execute()
+            def create():
+                if credentials:
+                    service = GoogleDocsHelpers._get_service(credentials)
+                else:
+                    service = GoogleDocsHelpers._get_service(
+                        {"access_token": access_token}
+                    )
 
-            doc_id = doc["documentId"]
+                doc = service.documents().create(body={"title": title}).execute()
 
-            # Add initial content if provided
-            if content:
-                # Parse markdown and create formatting requests
-                requests = GoogleDocsHelpers._parse_markdown_to_requests(
-                    content, start_index=1
-                )
+                # Add initial content if provided
+                if content:
+                    # Parse markdown and create formatting requests
+                    requests = GoogleDocsHelpers._parse_markdown_to_requests(
+                        content, start_index=1
+                    )
+
+                    if requests:
+                        service.documents().batchUpdate(
+                            documentId=doc["documentId"], body={"requests": requests}
+                        ).execute()
+
+                return doc
 
-                if requests:
-                    service.documents().batchUpdate(
-                        documentId=doc_id, body={"requests": requests}
-                    ).execute()
+            # Building the service and the round-trips are blocking; keep them
+            # off the event loop
+            doc = await asyncio.to_thread(create)
+
+            doc_id = doc["documentId"]
 
             return {
                 "success": True,
@@ -312,34 +323,45 @@ class GoogleDocsHelpers:
             Dict with operation status
         """
         try:
-            if credentials:
-                service = GoogleDocsHelpers._get_service(credentials)
-            else:
-                service = GoogleDocsHelpers._get_service({"access_token": access_token})
 
-            # Get document to find the end position
-            doc = service.documents().get(documentId=document_id).execute()
+            def append():
+                if credentials:
+                    service = GoogleDocsHelpers._get_service(credentials)
+                else:
+                    service = GoogleDocsHelpers._get_service(
+                        {"access_token": access_token}
+                    )
 
-            # Calculate the actual end index
-            end_index = 1
-            for element in doc.get("body", {}).get("content", []):
-                if "endIndex" in element:
-                    end_index = max(end_index, element["endIndex"])
-
-            # Parse markdown and create formatting requests
-            # Add a separator before new content
-            separator = "\n\n"
-            requests = GoogleDocsHelpers._parse_markdown_to_requests(
-                separator + content, start_index=end_index - 1
-            )
+                # Get document to find the end position
+                doc = service.documents().get(documentId=document_id).execute()
 
-            if requests:
-                result = (
+                # Calculate the actual end index
+                end_index = 1
+                for element in doc.get("body", {}).get("content", []):
+                    if "endIndex" in element:
+                        end_index = max(end_index, element["endIndex"])
+
+                # Parse markdown and create formatting requests
+                # Add a separator before new content
+                separator = "\n\n"
+                requests = GoogleDocsHelpers._parse_markdown_to_requests(
+                    separator + content, start_index=end_index - 1
+                )
+
+                if not requests:
+                    return None
+
+                return (
                     service.documents()
                     .batchUpdate(documentId=document_id, body={"requests": requests})
                     .execute()
                 )
 
+            # Building the service and the round-trips are blocking; keep them
+            # off the event loop
+            result = await asyncio.to_thread(append)
+
+            if result is not None:
                 return {"success": True, "replies": result.get("replies", [])}
 
             return {"success": True, "message": "No content to append"}
@@ -4,9 +4,10 @@ Provides CRUD operations for boards, lists, cards, etc.
 """
 
 from typing import Dict, List, Any, Optional
-import requests
 import logging
 
+from helpers._http import get_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,7 +38,7 @@ class TrelloHelpers:
                 "fields": "id,name,url,desc,dateLastActivity",
             }
 
-            response = requests.get(url, params=params)
+            response = await get_client().get(url, params=params)
             response.raise_for_status()
             boards = response.json()
 
@@ -70,7 +71,7 @@ class TrelloHelpers:
                 "fields": "id,name,pos,closed",
             }
 
-            response = requests.get(url, params=params)
+            response = await get_client().get(url, params=params)
             response.raise_for_status()
             lists = response.json()
 
@@ -103,7 +104,7 @@ class TrelloHelpers:
                 "fields": "id,name,desc,url,labels,due,closed,idMembers",
             }
 
-            response = requests.get(url, params=params)
+            response = await get_client().get(url, params=params)
             response.raise_for_status()
             cards = response.json()
 
@@ -153,7 +154,7 @@ class TrelloHelpers:
             if labels:
                 params["idLabels"] = ",".join(labels)
 
-            response = requests.post(url, params=params)
+            response = await get_client().post(url, params=params)
             response.raise_for_status()
             card = response.json()
 
@@ -195,7 +196,7 @@ class TrelloHelpers:
             if board_id:
                 params["idBoards"] = board_id
 
-            response = requests.get(url, params=params)
+            response = await get_client().get(url, params=params)
             response.raise_for_status()
             result = response.json()
             cards = result.get("cards", [])
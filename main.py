@@ -21,6 +21,7 @@ from team_orchestrator import TeamWorkflowOrchestrator
 from app_chat_orchestrator import AppChatOrchestrator
 from multi_app_orchestrator import MultiAppOrchestrator
 from services.email_service import EmailService
+from helpers._http import aclose_client
 
 load_dotenv()
 
@@ -60,6 +61,12 @@ team_orchestrator = TeamWorkflowOrchestrator(supabase_service, email_service)
 multi_app_orchestrator = MultiAppOrchestrator(supabase_service)
 
 
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close the pooled HTTP client shared by the helpers"""
+    await aclose_client()
+
+
 class RequiredApp(BaseModel):
     app_name: str
     is_connected: bool
@@ -651,6 +658,8 @@ async def connect_app(request: ConnectAppRequest):
         if not credential_id:
             raise HTTPException(status_code=500, detail="Failed to store credentials")
 
+        app_chat_orchestrator.invalidate_connected_apps(request.user_id)
+
         # Step 3: Create/update n8n credentials for this user
         logger.info(f"Creating n8n credentials for user {request.user_id}")
         n8n_credential_id = await supabase_service.store_user_credentials(
@@ -10,7 +10,7 @@ import google.generativeai as genai
 import os
 
 from services.supabase_service import SupabaseService
-from function_registry import get_functions_for_apps
+from function_registry import get_functions_for_apps, get_functions_json
 from services.gemini_service import GeminiService
 
 logger = logging.getLogger(__name__)
@@ -77,7 +77,7 @@ class MultiAppOrchestrator:
                     credentials = refreshed_credentials
 
             # Get all available functions for the required apps
-            available_functions = get_functions_for_apps(required_apps)
+            available_functions = get_functions_for_apps(tuple(sorted(required_apps)))
 
             # Use Gemini to determine execution plan
             execution_plan = await self._generate_execution_plan(
@@ -370,7 +370,7 @@ Respond in JSON format with:
         return f"""You are an expert multi-app workflow orchestrator for Blimp. Your role is to determine the optimal sequence and parameters for executing complex workflows across multiple apps.
 
 Available Functions by App:
-{json.dumps(available_functions, indent=2)}
+{get_functions_json(tuple(available_functions))}
 
 Guidelines for Orchestration:
 1. Analyze the workflow description and requirements
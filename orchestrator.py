@@ -7,16 +7,8 @@ import logging
 from typing import Dict, Any, List
 import importlib
 
+import utils
 from services.supabase_service import SupabaseService
-from utils.gcalendar_slack_utils import GCalendarSlackUtils
-from utils.gmail_calendar_utils import GmailCalendarUtils
-from utils.gmail_gdrive_utils import GmailGDriveUtils
-from utils.notion_discord_utils import NotionDiscordUtils
-from utils.notion_gmail_utils import NotionGmailUtils
-from utils.notion_slack_utils import NotionSlackUtils
-from utils.github_slack_utils import GitHubSlackUtils
-from utils.google_docs_trello_utils import GoogleDocsTrelloUtils
-from utils.trello_slack_utils import TrelloSlackUtils
 
 logger = logging.getLogger(__name__)
 
@@ -27,16 +19,18 @@ class WorkflowOrchestrator:
     def __init__(self, supabase_service: SupabaseService):
         self.supabase = supabase_service
 
+        # Utility class names per workflow, resolved through the utils
+        # package on first use so only the providers a workflow needs load
         self.utils_registry = {
-            "gmail_calendar": GmailCalendarUtils,
-            "gmail_gdrive": GmailGDriveUtils,
-            "notion_slack": NotionSlackUtils,
-            "notion_gmail": NotionGmailUtils,
-            "notion_discord": NotionDiscordUtils,
-            "gcalendar_slack": GCalendarSlackUtils,
-            "github_slack": GitHubSlackUtils,
-            "google_docs_trello": GoogleDocsTrelloUtils,
-            "trello_slack": TrelloSlackUtils,
+            "gmail_calendar": "GmailCalendarUtils",
+            "gmail_gdrive": "GmailGDriveUtils",
+            "notion_slack": "NotionSlackUtils",
+            "notion_gmail": "NotionGmailUtils",
+            "notion_discord": "NotionDiscordUtils",
+            "gcalendar_slack": "GCalendarSlackUtils",
+            "github_slack": "GitHubSlackUtils",
+            "google_docs_trello": "GoogleDocsTrelloUtils",
+            "trello_slack": "TrelloSlackUtils",
         }
 
         logger.info(
@@ -76,15 +70,15 @@ class WorkflowOrchestrator:
                     "error": f"No utility module found for apps: {required_apps}",
                 }
 
-            util_class = self.utils_registry.get(util_key)
-            if not util_class:
+            util_class_name = self.utils_registry.get(util_key)
+            if not util_class_name:
                 return {
                     "success": False,
                     "error": f"Utility module '{util_key}' not registered",
                 }
 
             # Initialize utility class with credentials
-            util_instance = util_class(credentials)
+            util_instance = getattr(utils, util_class_name)(credentials)
 
             # Execute based on workflow type
             result = await self._execute_workflow_logic(
@@ -11,19 +11,24 @@ import google.generativeai as genai
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
-from helpers.gmail_helpers import GMAIL_FUNCTIONS
-from helpers.google_docs_helpers import GOOGLE_DOCS_FUNCTIONS
-from helpers.slack_helpers import SLACK_FUNCTIONS
-from helpers.gcalendar_helpers import GCALENDAR_FUNCTIONS
-from helpers.gdrive_helpers import GDRIVE_FUNCTIONS
-from helpers.trello_helpers import TRELLO_FUNCTIONS
-from helpers.github_helpers import GITHUB_FUNCTIONS
+from function_registry import get_functions_for_apps
 
 from services.gemini_service import GeminiService
 from services.supabase_service import SupabaseService
 
 logger = logging.getLogger(__name__)
 
+# Apps App Chat can query; their registries are loaded on first use
+APP_CHAT_APPS = (
+    "gmail",
+    "slack",
+    "google_calendar",
+    "google_docs",
+    "google_drive",
+    "trello",
+    "github",
+)
+
 
 class AppChatService:
     """Service for AI-powered app chat interactions"""
@@ -32,6 +37,9 @@ class AppChatService:
         self.api_key = os.getenv("GEMINI_API_KEY")
         self.gemini_service = GeminiService()
         self.supabase_service = SupabaseService()
+        # Response-generation system prompts only depend on the app, so they
+        # are built once per app and reused
+        self._response_prompts: Dict[str, str] = {}
         if self.api_key:
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel("gemini-2.5-flash")
@@ -45,11 +53,19 @@ class AppChatService:
         return self.gemini_service.is_configured()
 
     async def analyze_query(
-        self, query: str, inquiry_app: str, connected_apps: List[str], user_id: str
+        self,
+        query: str,
+        inquiry_app: str,
+        connected_apps: List[str],
+        user_id: str,
+        user_profile: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Analyze user query and determine what data to fetch,
         with automatic detection of the user's timezone for time-specific reasoning.
+
+        If the caller already fetched the user's profile it can be passed as
+        user_profile to skip the extra Supabase round-trip.
         """
         try:
             if not self.gemini_service.is_configured():
@@ -60,7 +76,10 @@ class AppChatService:
 
             # 🕒 Detect user's timezone (fallback to UTC)
             try:
-                user_profile = await self.supabase_service.get_user_profile(user_id)
+                if user_profile is None:
+                    user_profile = await self.supabase_service.get_user_profile(
+                        user_id
+                    )
                 user_timezone = (
                     user_profile.get("timezone")
                     if user_profile and user_profile.get("timezone")
@@ -296,6 +315,7 @@ NOW ANALYZE THE USER'S QUERY AND RESPOND WITH VALID JSON:
         context: Optional[Dict[str, Any]] = None,
         query_type: str = "informational",
         actions_taken: List[Dict[str, Any]] = None,
+        system_prompt: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Generate AI response based on fetched data
@@ -306,6 +326,8 @@ NOW ANALYZE THE USER'S QUERY AND RESPOND WITH VALID JSON:
             data_type: Type of data (email, message, event)
             inquiry_app: The app being queried
             context: Additional context
+            system_prompt: Prompt from prepare_response_prompt, if the caller
+                prepared it ahead of time
 
         Returns:
             Dict with AI-generated response
@@ -315,9 +337,8 @@ NOW ANALYZE THE USER'S QUERY AND RESPOND WITH VALID JSON:
                 return {"success": False, "error": "App Chat service not configured"}
 
             # Build prompt
-            system_prompt = self._build_response_generation_prompt(
-                inquiry_app, data_type
-            )
+            if system_prompt is None:
+                system_prompt = self.prepare_response_prompt(inquiry_app)
 
             # Build user message based on query type
             if query_type == "actionable" and actions_taken:
@@ -402,18 +423,32 @@ Respond in JSON format as specified in the system prompt.
             logger.error(f"Error generating response: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
+    def prepare_response_prompt(self, inquiry_app: str) -> str:
+        """
+        Get the system prompt for response generation
+
+        The prompt only depends on the app, not on the fetched data, so
+        callers can prepare it before the data fetch completes.
+
+        Args:
+            inquiry_app: The app being queried
+
+        Returns:
+            System prompt string
+        """
+        key = (inquiry_app or "").lower()
+        prompt = self._response_prompts.get(key)
+        if prompt is None:
+            prompt = self._build_response_generation_prompt(inquiry_app, None)
+            self._response_prompts[key] = prompt
+        return prompt
+
     def _get_app_functions(self, app_name: str) -> Dict[str, Any]:
         """Get available functions for an app"""
-        function_map = {
-            "gmail": GMAIL_FUNCTIONS,
-            "slack": SLACK_FUNCTIONS,
-            "google_calendar": GCALENDAR_FUNCTIONS,
-            "google_docs": GOOGLE_DOCS_FUNCTIONS,
-            "google_drive": GDRIVE_FUNCTIONS,
-            "trello": TRELLO_FUNCTIONS,
-            "github": GITHUB_FUNCTIONS,
-        }
-        return function_map.get(app_name.lower(), {})
+        app_key = app_name.lower()
+        if app_key not in APP_CHAT_APPS:
+            return {}
+        return get_functions_for_apps((app_key,))[app_key]
 
     def _build_query_analysis_prompt(
         self,
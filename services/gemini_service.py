@@ -9,7 +9,7 @@ import json
 from typing import Dict, Any, List, Optional
 import google.generativeai as genai
 
-from function_registry import FUNCTION_REGISTRY, get_functions_for_apps
+from function_registry import get_functions_json, get_registry_json
 
 logger = logging.getLogger(__name__)
 
@@ -305,7 +305,7 @@ User's Connected Apps:
 {connected_apps_str}
 
 Available App Functions:
-{json.dumps(FUNCTION_REGISTRY, indent=2)}
+{get_registry_json()}
 
 Guidelines:
 1. Match user requests to existing templates when possible (look for semantic similarity)
@@ -342,7 +342,7 @@ Common Workflow Patterns:
 
             # Get available functions for required apps
             required_apps = workflow.get("required_apps", [])
-            available_functions = get_functions_for_apps(required_apps)
+            functions_json = get_functions_json(tuple(sorted(required_apps)))
 
             prompt = f"""
 Workflow: {workflow.get('name')}
@@ -351,7 +351,7 @@ Required Apps: {', '.join(required_apps)}
 Parameters: {json.dumps(parameters)}
 
 Available Functions:
-{json.dumps(available_functions, indent=2)}
+{functions_json}
 
 Determine the sequence of function calls needed to execute this workflow.
 Consider the workflow description and parameters to decide which functions to call and in what order.
@@ -43,6 +43,15 @@ class SecurityFilter:
         ],
     }
 
+    # Patterns compiled once, in the order they are applied. Each pass runs
+    # over the previous pass's output, so overlapping and adjacent matches
+    # resolve exactly as with re.sub per pattern
+    _COMPILED_PATTERNS = [
+        (re.compile(pattern, re.IGNORECASE), f"[REDACTED_{category.upper()}]")
+        for category, patterns in SENSITIVE_PATTERNS.items()
+        for pattern in patterns
+    ]
+
     @staticmethod
     def filter_text(text: str) -> str:
         """
@@ -59,14 +68,8 @@ class SecurityFilter:
 
         filtered_text = text
 
-        for category, patterns in SecurityFilter.SENSITIVE_PATTERNS.items():
-            for pattern in patterns:
-                filtered_text = re.sub(
-                    pattern,
-                    f"[REDACTED_{category.upper()}]",
-                    filtered_text,
-                    flags=re.IGNORECASE,
-                )
+        for pattern, replacement in SecurityFilter._COMPILED_PATTERNS:
+            filtered_text = pattern.sub(replacement, filtered_text)
 
         return filtered_text
 
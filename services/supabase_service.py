@@ -3,6 +3,7 @@ Supabase Service - Database operations
 Handles all interactions with Supabase database
 """
 
+import asyncio
 import os
 import logging
 from typing import List, Dict, Any, Optional
@@ -35,12 +36,14 @@ class SupabaseService:
                 logger.error("Supabase client not initialized")
                 return []
 
-            response = (
+            # Run the blocking request off the event loop so it can overlap
+            # with other work (e.g. get_user_profile in process_query)
+            response = await asyncio.to_thread(
                 self.client.table("user_credentials")
                 .select("app_name")
                 .eq("user_id", user_id)
                 .eq("is_active", True)
-                .execute()
+                .execute
             )
 
             if response.data:
@@ -64,12 +67,12 @@ class SupabaseService:
                 logger.error("Supabase client not initialized")
                 return None
 
-            response = (
+            response = await asyncio.to_thread(
                 self.client.table("profiles")
                 .select("*")
                 .eq("id", user_id)
                 .single()
-                .execute()
+                .execute
             )
 
             return response.data
@@ -568,14 +571,15 @@ class SupabaseService:
                 logger.error("Supabase client not initialized")
                 return None
 
-            response = (
+            # Off the event loop so lookups for several apps can overlap
+            response = await asyncio.to_thread(
                 self.client.table("user_credentials")
                 .select("credentials, metadata")
                 .eq("user_id", user_id)
                 .eq("app_type", app_name)
                 .eq("is_active", True)
                 .single()
-                .execute()
+                .execute
             )
 
             if not response.data:
@@ -583,7 +587,32 @@ class SupabaseService:
                 return None
 
             credentials = response.data.get("credentials", {})
+            return await self.refresh_credentials_if_needed(
+                user_id, app_name, credentials
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Error in get_and_refresh_credentials for {app_name}: {str(e)}"
+            )
+            return None
+
+    async def refresh_credentials_if_needed(
+        self, user_id: str, app_name: str, credentials: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Refresh stored credentials if they are expired or expiring soon.
+        Handles both ISO string and timestamp formats for expiry_date.
+
+        Args:
+            user_id: User's unique identifier
+            app_name: Name of the app (e.g., "gmail", "calendar", "gdrive")
+            credentials: Credentials as stored in user_credentials
 
+        Returns:
+            Dict with valid credentials or None if refresh failed
+        """
+        try:
             expiry_raw = credentials.get("expiry_date")
             refresh_token = credentials.get("refresh_token")
 
@@ -722,9 +751,7 @@ class SupabaseService:
             return credentials
 
         except Exception as e:
-            logger.error(
-                f"Error in get_and_refresh_credentials for {app_name}: {str(e)}"
-            )
+            logger.error(f"Error refreshing credentials for {app_name}: {str(e)}")
             return None
 
     async def create_team_workflow(
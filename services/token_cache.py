@@ -0,0 +1,116 @@
+"""
+Token Cache
+In-memory TTL cache for refreshed OAuth credentials
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """
+    Cache refreshed credentials per key (e.g. (user_id, app_name)).
+
+    Concurrent lookups for the same key share a single fetch, so a burst of
+    requests triggers at most one Supabase read / token refresh.
+    """
+
+    # SupabaseService refreshes tokens 5 minutes before expiry, so cached
+    # entries must expire before that window to let the refresh happen
+    REFRESH_MARGIN_SECONDS = 360
+
+    # Used when the credentials carry no usable expiry information
+    DEFAULT_TTL_SECONDS = 300
+
+    # Upper bound on how long credentials are reused. Reconnects and
+    # revocations handled by another worker process are only noticed once
+    # the entry expires
+    MAX_TTL_SECONDS = 300
+
+    # Upper bound on cached credentials; least recently used go first
+    MAXSIZE = 4096
+
+    def __init__(self, maxsize: int = MAXSIZE):
+        self._entries = TTLCache(maxsize=maxsize, ttl=self.DEFAULT_TTL_SECONDS)
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetcher: Callable[[], Awaitable[Optional[Dict[str, Any]]]],
+        ttl: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return cached credentials for key, fetching them if missing or stale
+
+        Args:
+            key: Cache key
+            fetcher: Coroutine factory returning fresh credentials (or None)
+            ttl: Seconds to cache the result; derived from the credentials'
+                expiry_date when omitted. Capped at MAX_TTL_SECONDS
+
+        Returns:
+            Credentials dict, or None if the fetcher returned None
+        """
+        credentials = self._entries.get(key)
+        if credentials is not None:
+            return credentials
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another task may have fetched while we waited for the lock
+                credentials = self._entries.get(key)
+                if credentials is not None:
+                    return credentials
+
+                credentials = await fetcher()
+                if not credentials:
+                    return credentials
+
+                if ttl is None:
+                    ttl = self._ttl_for(credentials)
+                ttl = min(ttl, self.MAX_TTL_SECONDS)
+                if ttl > 0:
+                    self._entries.set(key, credentials, ttl)
+
+                return credentials
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached credentials for key"""
+        self._entries.pop(key)
+
+    def invalidate_matching(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the cached credentials for every key matching predicate"""
+        self._entries.invalidate(predicate)
+
+    def _ttl_for(self, credentials: Dict[str, Any]) -> float:
+        """Seconds the credentials can be cached before they need refreshing"""
+        expiry_raw = credentials.get("expiry_date")
+
+        try:
+            if isinstance(expiry_raw, str):
+                expiry_dt = datetime.fromisoformat(expiry_raw.replace("Z", "+00:00"))
+                if expiry_dt.tzinfo is None:
+                    expiry_dt = expiry_dt.replace(tzinfo=timezone.utc)
+                remaining = (expiry_dt - datetime.now(timezone.utc)).total_seconds()
+            elif isinstance(expiry_raw, (int, float)):
+                # Timestamp in milliseconds
+                remaining = int(expiry_raw) / 1000 - time.time()
+            else:
+                return self.DEFAULT_TTL_SECONDS
+        except Exception as e:
+            logger.warning(f"Could not parse expiry_date for caching: {str(e)}")
+            return self.DEFAULT_TTL_SECONDS
+
+        return max(0.0, remaining - self.REFRESH_MARGIN_SECONDS)
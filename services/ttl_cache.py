@@ -0,0 +1,100 @@
+"""
+TTL Cache
+Small in-memory LRU cache with per-entry expiry for async callers
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire after a time-to-live.
+
+    get_or_fetch coalesces concurrent misses for the same key into a single
+    fetch, so a burst of identical requests hits the backend once.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value under key, evicting the least recently used entry if full"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        """Remove and return the cached value for key, or None if missing or expired"""
+        value = self.get(key)
+        self._entries.pop(key, None)
+        return value
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches predicate"""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetcher: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool] = lambda value: value is not None,
+    ) -> Any:
+        """
+        Return the cached value for key, fetching and caching it on a miss
+
+        Args:
+            key: Cache key
+            fetcher: Coroutine factory producing the value
+            should_cache: Decides whether a fetched value is stored
+                (e.g. only successful responses)
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another task may have fetched while we waited for the lock
+                value = self.get(key)
+                if value is not None:
+                    return value
+
+                value = await fetcher()
+                if should_cache(value):
+                    self.set(key, value)
+                return value
+        finally:
+            if not lock.locked():
+                self._locks.pop(key, None)
@@ -7,14 +7,9 @@ import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+import utils
 from services.supabase_service import SupabaseService
 from services.email_service import EmailService
-from utils.gmail_calendar_utils import GmailCalendarUtils
-from utils.gmail_gdrive_utils import GmailGDriveUtils
-from utils.notion_slack_utils import NotionSlackUtils
-from utils.notion_gmail_utils import NotionGmailUtils
-from utils.notion_discord_utils import NotionDiscordUtils
-from utils.gcalendar_slack_utils import GCalendarSlackUtils
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +21,15 @@ class TeamWorkflowOrchestrator:
         self.supabase = supabase_service
         self.email_service = email_service
 
+        # Utility class names per workflow, resolved through the utils
+        # package on first use so only the providers a workflow needs load
         self.utils_registry = {
-            "gmail_calendar": GmailCalendarUtils,
-            "gmail_gdrive": GmailGDriveUtils,
-            "notion_slack": NotionSlackUtils,
-            "notion_gmail": NotionGmailUtils,
-            "notion_discord": NotionDiscordUtils,
-            "gcalendar_slack": GCalendarSlackUtils,
+            "gmail_calendar": "GmailCalendarUtils",
+            "gmail_gdrive": "GmailGDriveUtils",
+            "notion_slack": "NotionSlackUtils",
+            "notion_gmail": "NotionGmailUtils",
+            "notion_discord": "NotionDiscordUtils",
+            "gcalendar_slack": "GCalendarSlackUtils",
         }
 
         logger.info(
@@ -429,15 +426,15 @@ class TeamWorkflowOrchestrator:
                     "error": f"No utility module for apps: {required_apps}",
                 }
 
-            util_class = self.utils_registry.get(util_key)
-            if not util_class:
+            util_class_name = self.utils_registry.get(util_key)
+            if not util_class_name:
                 return {
                     "success": False,
                     "error": f"Utility module '{util_key}' not registered",
                 }
 
             # Initialize utility instance
-            util_instance = util_class(credentials)
+            util_instance = getattr(utils, util_class_name)(credentials)
 
             # Execute workflow logic
             result = await self._execute_workflow_logic(
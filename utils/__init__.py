@@ -1,17 +1,34 @@
 """Utils package for inter-app connector functions."""
 
-from .gmail_calendar_utils import GmailCalendarUtils
-from .gmail_gdrive_utils import GmailGDriveUtils
-from .notion_slack_utils import NotionSlackUtils
-from .notion_gmail_utils import NotionGmailUtils
-from .notion_discord_utils import NotionDiscordUtils
-from .gcalendar_slack_utils import GCalendarSlackUtils
-
-__all__ = [
-    "GmailCalendarUtils",
-    "GmailGDriveUtils",
-    "NotionSlackUtils",
-    "NotionGmailUtils",
-    "NotionDiscordUtils",
-    "GCalendarSlackUtils",
-]
+import importlib
+
+# Public name -> submodule defining it. Submodules (and the helper SDKs they
+# pull in) are imported the first time one of their names is accessed
+# (PEP 562), so importing one connector doesn't load every provider.
+_LAZY = {
+    "GmailCalendarUtils": ".gmail_calendar_utils",
+    "GmailGDriveUtils": ".gmail_gdrive_utils",
+    "NotionSlackUtils": ".notion_slack_utils",
+    "NotionGmailUtils": ".notion_gmail_utils",
+    "NotionDiscordUtils": ".notion_discord_utils",
+    "GCalendarSlackUtils": ".gcalendar_slack_utils",
+    "GitHubSlackUtils": ".github_slack_utils",
+    "GoogleDocsTrelloUtils": ".google_docs_trello_utils",
+    "TrelloSlackUtils": ".trello_slack_utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -3,9 +3,10 @@ Gmail to Google Calendar Utility Functions
 Inter-app connector for automating email to calendar workflows
 """
 
+import asyncio
 import logging
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 import re
 import requests
@@ -16,6 +17,10 @@ from email.utils import parsedate_to_datetime
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of emails fetched and turned into events at once; the
+# email count comes from the caller, and Gmail/Calendar quotas are per user
+EMAIL_EVENT_CONCURRENCY = 10
+
 
 class GmailCalendarUtils:
     """Utility functions for Gmail to Google Calendar automation"""
@@ -185,46 +190,23 @@ class GmailCalendarUtils:
                     "message": "No emails found matching query",
                 }
 
-            # Step 2: Process each email and create calendar events
+            # Step 2: Process each email and create calendar events; the
+            # emails are independent, so their fetch + create run concurrently
             created_events = []
             errors = []
 
-            for msg in messages:
-                try:
-                    # Get full email details
-                    email_result = await GmailHelpers.get_message(
-                        access_token=self.gmail_token, message_id=msg["id"]
-                    )
-
-                    if not email_result.get("success"):
-                        errors.append(f"Failed to get email {msg['id']}")
-                        continue
-
-                    email_data = email_result["message"]
-
-                    # Extract email information
-                    subject = self._get_header(email_data, "Subject")
-                    from_email = self._get_header(email_data, "From")
-                    date_str = self._get_header(email_data, "Date")
-                    body = self._extract_body(email_data)
-
-                    # Create calendar event
-                    event_result = await self._create_event_from_email(
-                        subject=subject,
-                        from_email=from_email,
-                        body=body,
-                        email_date=date_str,
-                    )
-
-                    if event_result.get("success"):
-                        created_events.append(event_result["event"])
-                        logger.info(f"Created event for email: {subject}")
-                    else:
-                        errors.append(f"Failed to create event for: {subject}")
-
-                except Exception as e:
-                    logger.error(f"Error processing email {msg.get('id')}: {str(e)}")
-                    errors.append(str(e))
+            semaphore = asyncio.Semaphore(EMAIL_EVENT_CONCURRENCY)
+
+            async def process(msg):
+                async with semaphore:
+                    return await self._process_email_to_event(msg)
+
+            outcomes = await asyncio.gather(*(process(msg) for msg in messages))
+            for event, error in outcomes:
+                if event is not None:
+                    created_events.append(event)
+                else:
+                    errors.append(error)
 
             return {
                 "success": True,
@@ -238,6 +220,50 @@ class GmailCalendarUtils:
             logger.error(f"Error in emails_to_calendar_events: {str(e)}", exc_info=True)
             return {"success": False, "error": str(e)}
 
+    async def _process_email_to_event(
+        self, msg: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch one email and create its calendar event
+
+        Returns:
+            (created event, None) on success, or (None, error message)
+        """
+        try:
+            # Get full email details
+            email_result = await GmailHelpers.get_message(
+                access_token=self.gmail_token, message_id=msg["id"]
+            )
+
+            if not email_result.get("success"):
+                return None, f"Failed to get email {msg['id']}"
+
+            email_data = email_result["message"]
+
+            # Extract email information
+            subject = self._get_header(email_data, "Subject")
+            from_email = self._get_header(email_data, "From")
+            date_str = self._get_header(email_data, "Date")
+            body = self._extract_body(email_data)
+
+            # Create calendar event
+            event_result = await self._create_event_from_email(
+                subject=subject,
+                from_email=from_email,
+                body=body,
+                email_date=date_str,
+            )
+
+            if event_result.get("success"):
+                logger.info(f"Created event for email: {subject}")
+                return event_result["event"], None
+
+            return None, f"Failed to create event for: {subject}"
+
+        except Exception as e:
+            logger.error(f"Error processing email {msg.get('id')}: {str(e)}")
+            return None, str(e)
+
     async def _create_event_from_email(
         self, subject: str, from_email: str, body: str, email_date: str
     ) -> Dict[str, Any]: